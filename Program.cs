@@ -315,7 +315,7 @@ public class DocumentRedactor
     {
         return new List<RedactionRule>
         {
-            new RedactionRule(@"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL_REDACTED]"),
+            new RedactionRule(@"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "[EMAIL_REDACTED]"),
             new RedactionRule(@"\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b", "[PHONE_REDACTED]"),
             new RedactionRule(@"\b\d{3}-\d{2}-\d{4}\b", "[SSN_REDACTED]"),
             new RedactionRule(@"\b(?:\d{4}[-\s]?){3}\d{4}\b", "[CREDIT_CARD_REDACTED]"),
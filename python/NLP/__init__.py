@@ -7,12 +7,13 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __description__ = "Azure AI-powered document redaction tool"
 
-from .azure_config import AzureConfig
+from .azure_config import AzureConfig, get_config
 from .azure_ai_redactor import AzureAIRedactor, PIIEntity, RedactionResult
 from .azure_document_processor import AzureDocumentProcessor, AzureDocxProcessor, AzurePdfProcessor
 
 __all__ = [
     'AzureConfig',
+    'get_config',
     'AzureAIRedactor',
     'PIIEntity',
     'RedactionResult',
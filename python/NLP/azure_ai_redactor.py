@@ -4,16 +4,108 @@ Uses Azure Text Analytics for intelligent entity recognition and redaction
 """
 
 import re
-from typing import List, Dict, Tuple, Optional, Any
+import asyncio
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterable, Iterator
 from dataclasses import dataclass
-from azure.ai.textanalytics import RecognizePiiEntitiesResult
-import structlog
 
-from azure_config import AzureConfig
+from azure_config import AzureConfig, get_config
+from demo_redactor import get_demo_redactor
+from logging_compat import get_logger
+from pii_hot import luhn_valid, merge_intervals
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
-@dataclass
+# Azure Text Analytics limits per document and per request
+_AZURE_MAX_CHARS = 5000
+_AZURE_MAX_BATCH_DOCUMENTS = 5
+
+# Azure requests in flight at once for a single text
+_AZURE_MAX_CONCURRENT_REQUESTS = 8
+
+# The extra '+' of a possessive quantifier (a*+, a++, a?+, a{n,m}+), skipping escaped '\*', '\+', '\?'
+_POSSESSIVE = re.compile(r'(?<=[^\\][*+?}])\+')
+
+# Characters on which RE2 and re can match differently: RE2's \b, \w, \d and \s
+# are ASCII-only (and its \s leaves out \v), while re's are Unicode and its
+# re.IGNORECASE folds 'ſ' and the Kelvin sign into [a-z]. Text containing any
+# of them is matched with re even when RE2 is the configured engine
+_RE2_UNSAFE = re.compile(r'[^\x00-\x0a\x0c-\x1b\x20-\x7f]')
+
+# A character every match of the category contains; if the text has none,
+# the category's patterns are not run at all
+_CATEGORY_PROBES = MappingProxyType({
+    'credit_card': r'\d',
+    'phone': r'\d',
+    'ssn': r'\d',
+    'address': r'\d',
+    'email': '@',
+})
+
+# Card numbers laid out as cards are: 13-19 contiguous digits, or 4-4-4-4 and
+# 4-6-5 groups split by one repeated space or hyphen. A grouped candidate must
+# not continue a longer run of groups (invoice or part number lists), and
+# every candidate is Luhn-checked whole
+_CARD_CANDIDATE = re.compile(
+    r'\b(?:\d{13,19}'
+    r'|(?<!\d[ \-])(?:\d{4}([ \-])\d{4}\1\d{4}\1\d{4}|\d{4}([ \-])\d{6}\2\d{5})(?![ \-]\d))\b',
+    re.ASCII
+)
+
+# Default redaction patterns
+_DEFAULT_REDACTION_MAP = MappingProxyType({
+    'Person': '[NAME_REDACTED]',
+    'PersonType': '[TITLE_REDACTED]',
+    'PhoneNumber': '[PHONE_REDACTED]',
+    'Address': '[ADDRESS_REDACTED]',
+    'CreditCardNumber': '[CREDIT_CARD_REDACTED]',
+    'Email': '[EMAIL_REDACTED]',
+    'URL': '[URL_REDACTED]',
+    'IPAddress': '[IP_ADDRESS_REDACTED]',
+    'DateTime': '[DATE_REDACTED]',
+    'credit_card': '[CREDIT_CARD_REDACTED]',
+    'phone': '[PHONE_REDACTED]',
+    'ssn': '[SSN_REDACTED]',
+    'email': '[EMAIL_REDACTED]'
+})
+
+# Risk weights per category (anything else counts once)
+_RISK_MULTIPLIERS = MappingProxyType({
+    'CreditCardNumber': 5,
+    'PhoneNumber': 3,
+    'Address': 4,
+    'Person': 2,
+    'Email': 2
+})
+
+_HIGH_RISK_CATEGORIES = frozenset({'CreditCardNumber', 'PhoneNumber', 'Address'})
+
+@lru_cache(maxsize=None)
+def _generated_token(category: str) -> str:
+    """Token for a category missing from the redaction map, formatted once per category"""
+    return f'[{category.upper()}_REDACTED]'
+
+def redaction_token(category: str, redaction_map: Optional[Dict[str, str]] = None) -> str:
+    """
+    Return the replacement token for an entity category
+    
+    Args:
+        category: Entity category
+        redaction_map: Category to token map (defaults to the built-in map)
+        
+    Returns:
+        Token such as '[NAME_REDACTED]'
+    """
+    if redaction_map is None:
+        redaction_map = _DEFAULT_REDACTION_MAP
+    token = redaction_map.get(category)
+    return token if token is not None else _generated_token(category)
+
+@dataclass(slots=True, frozen=True)
 class PIIEntity:
     """Represents a detected PII entity"""
     text: str
@@ -23,15 +115,143 @@ class PIIEntity:
     offset: int
     length: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedactionResult:
     """Results from document redaction"""
     original_text: str
     redacted_text: str
-    entities_found: List[PIIEntity]
+    entities_found: Tuple[PIIEntity, ...]
     redaction_count: int
     confidence_scores: Dict[str, float]
 
+def _merge_intervals(entities: Iterable[PIIEntity]) -> List[PIIEntity]:
+    """
+    Drop entities that overlap an already accepted one
+    
+    Args:
+        entities: Entities in priority order (earlier entries win overlaps)
+        
+    Returns:
+        Non-overlapping entities in the order they were accepted
+    """
+    entities = list(entities)
+    keep = merge_intervals(
+        [entity.offset for entity in entities],
+        [entity.offset + entity.length for entity in entities]
+    )
+    return [entity for entity, kept in zip(entities, keep) if kept]
+
+def _resolve_entities(azure_entities: Iterable[PIIEntity], regex_entities: Iterable[PIIEntity]) -> List[PIIEntity]:
+    """
+    Combine Azure and (already deduplicated) regex entities, keeping the most confident on overlaps
+    
+    Args:
+        azure_entities: Entities from Azure Text Analytics
+        regex_entities: Non-overlapping entities from the regex fallback
+        
+    Returns:
+        Non-overlapping entities in confidence order (ties keep Azure first)
+    """
+    return _merge_intervals(
+        sorted([*azure_entities, *regex_entities], key=lambda x: -x.confidence_score)
+    )
+
+def _split_chunks(text: str) -> Tuple[List[int], List[str]]:
+    """
+    Split text into Azure-sized chunks
+    
+    Args:
+        text: Text to split
+        
+    Returns:
+        Tuple of (absolute offset of each chunk, chunk texts)
+    """
+    offsets = list(range(0, len(text), _AZURE_MAX_CHARS))
+    return offsets, [text[offset:offset+_AZURE_MAX_CHARS] for offset in offsets]
+
+class _Re2Pattern:
+    """RE2 pattern that leaves text RE2 would match differently (see _RE2_UNSAFE) to re"""
+    
+    def __init__(self, re2_pattern: Any, re_pattern: re.Pattern):
+        self._re2 = re2_pattern
+        self._re = re_pattern
+        self.groups = re_pattern.groups
+    
+    def _engine(self, text: str) -> Any:
+        return self._re if _RE2_UNSAFE.search(text) else self._re2
+    
+    def search(self, text: str) -> Any:
+        return self._engine(text).search(text)
+    
+    def finditer(self, text: str) -> Iterator[Any]:
+        return self._engine(text).finditer(text)
+
+def _get_regex_compiler(engine: str) -> Callable[..., Any]:
+    """
+    Return a pattern compiler for the configured regex engine
+    
+    Args:
+        engine: 're' (standard library), 'regex' or 're2'
+        
+    Returns:
+        Callable taking (pattern, flags) with standard re flag semantics
+    """
+    if engine == 'regex':
+        try:
+            import regex
+        except ImportError:
+            logger.warning("regex module not installed, using standard re")
+            return re.compile
+        
+        def compile_regex(pattern: str, flags: int = 0):
+            return regex.compile(pattern, flags | regex.VERSION1)
+        
+        return compile_regex
+    
+    if engine == 're2':
+        try:
+            import re2
+        except ImportError:
+            logger.warning("google-re2 not installed, using standard re")
+            return re.compile
+        
+        def compile_re2(pattern: str, flags: int = 0):
+            options = re2.Options()
+            options.case_sensitive = not (flags & re.IGNORECASE)
+            options.max_mem = 8 << 20
+            # RE2 never backtracks, so possessive quantifiers are plain greedy ones there
+            return _Re2Pattern(re2.compile(_POSSESSIVE.sub('', pattern), options), re.compile(pattern, flags))
+        
+        return compile_re2
+    
+    if engine != 're':
+        logger.warning("Unknown regex engine, using standard re", engine=engine)
+    return re.compile
+
+def _union_patterns(specs: List[Tuple[str, int]], compile_pattern: Callable[..., Any]) -> List[Any]:
+    """
+    Compile a category's patterns, merging the group-free ones into one alternation
+    
+    Args:
+        specs: (pattern source, re flags) pairs in priority order
+        compile_pattern: Compiler returned by _get_regex_compiler
+        
+    Returns:
+        Compiled patterns; contextual patterns keep their own scan because an
+        alternation would consume the keyword and hide matches starting inside it
+    """
+    plain: Dict[int, List[str]] = {}
+    contextual = []
+    for source, flags in specs:
+        if re.compile(source).groups:
+            contextual.append(compile_pattern(source, flags))
+        else:
+            plain.setdefault(flags, []).append(f'(?:{source})')
+    
+    return [
+        compile_pattern('|'.join(sources), flags) for flags, sources in plain.items()
+    ] + contextual
+
 class AzureAIRedactor:
     """Azure AI-powered document redaction engine"""
     
@@ -42,7 +262,7 @@ class AzureAIRedactor:
         Args:
             config: Azure configuration instance
         """
-        self.config = config or AzureConfig()
+        self.config = config or get_config()
         
         if not self.config.validate_configuration():
             raise ValueError("Invalid Azure configuration")
@@ -53,36 +273,44 @@ class AzureAIRedactor:
         # Enhanced regex patterns with contextual detection
         self.custom_patterns = {
             'credit_card': [
-                re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),  # Standard format
-                re.compile(r'\b\d{13,19}\b'),  # Generic long number
-                re.compile(r'(?i)(?:card|cc|credit)\s*:?\s*(\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})', re.IGNORECASE),
+                (r'(?i)(?:card|cc|credit)\s*+:?\s*+(\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})', re.ASCII),
             ],
             'phone': [
-                re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),  # Standard
-                re.compile(r'\(\d{3}\)\s?\d{3}-?\d{4}'),  # (555) 123-4567 format
-                re.compile(r'(?i)(?:phone|tel|mobile|cell)\s*:?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE),
-                re.compile(r'(?i)(?:contact|call)\s*:?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE),
+                (r'\b(?:\+?1[-.\s]?)?\(?(?:[0-9]{3})\)?[-.\s]?(?:[0-9]{3})[-.\s]?(?:[0-9]{4})\b', re.ASCII),  # Standard
+                (r'\(\d{3}\)\s?\d{3}-?\d{4}', re.ASCII),  # (555) 123-4567 format
+                (r'(?i)(?:phone|tel|mobile|cell)\s*+:?\s*+(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.ASCII),
+                (r'(?i)(?:contact|call)\s*+:?\s*+(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.ASCII),
             ],
             'ssn': [
-                re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),  # Standard SSN
-                re.compile(r'\b\d{3}\s\d{2}\s\d{4}\b'),  # Space separated
-                re.compile(r'\b\d{9}\b'),  # No separators
-                re.compile(r'(?i)(?:ssn|social\s*security)\s*:?\s*(\d{3}[-\s]?\d{2}[-\s]?\d{4})', re.IGNORECASE),
+                (r'\b\d{3}-\d{2}-\d{4}\b', re.ASCII),  # Standard SSN
+                (r'\b\d{3}\s\d{2}\s\d{4}\b', re.ASCII),  # Space separated
+                (r'\b\d{9}\b', re.ASCII),  # No separators
+                (r'(?i)(?:ssn|social\s*security)\s*+:?\s*+(\d{3}[-\s]?\d{2}[-\s]?\d{4})', re.ASCII),
             ],
             'email': [
-                re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-                re.compile(r'(?i)(?:email|e-mail)\s*:?\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', re.IGNORECASE),
+                (r'\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', re.ASCII),
+                (r'(?i)(?:email|e-mail)\s*+:?\s*+([A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Za-z]{2,})', re.ASCII),
             ],
             'address': [
-                re.compile(r'\b\d{1,5}\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Ct|Court|Circle|Cir|Place|Pl)\b', re.IGNORECASE),
-                re.compile(r'(?i)(?:address|addr)\s*:?\s*(\d{1,5}\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd))', re.IGNORECASE),
+                (r'\b\d{1,5}+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Ct|Court|Circle|Cir|Place|Pl)\b', re.IGNORECASE),
+                (r'(?i)(?:address|addr)\s*+:?\s*+(\d{1,5}+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd))', 0),
             ],
             'name_context': [
-                re.compile(r'(?i)(?:name|employee|person|contact)\s*:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
-                re.compile(r'(?i)(?:from|to|by|signed)\s*:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
+                (r'(?i)(?:name|employee|person|contact)\s*+:?\s*+([A-Z][a-z]++\s++[A-Z][a-z]+)', 0),
+                (r'(?i)(?:from|to|by|signed)\s*+:?\s*+([A-Z][a-z]++\s++[A-Z][a-z]+)', 0),
             ]
         }
         
+        # Group-free patterns of a category share a single scan
+        compile_pattern = _get_regex_compiler(self.config.regex_engine)
+        self._category_patterns = {
+            category: _union_patterns(specs, compile_pattern)
+            for category, specs in self.custom_patterns.items()
+        }
+        
+        # Cheap local scan that decides whether a text is worth an Azure call
+        self._prefilter = get_demo_redactor() if self.config.azure_prefilter else None
+        
         logger.info("Azure AI Redactor initialized", 
                    threshold=self.confidence_threshold,
                    categories=self.config.pii_categories)
@@ -97,70 +325,17 @@ class AzureAIRedactor:
         Returns:
             List of detected PII entities from both Azure and regex
         """
-        all_entities = []
+        all_entities = list(self._azure_candidates(text))
         
-        try:
-            # First, try Azure Text Analytics
-            max_chars = 5000
-            chunks = [text[i:i+max_chars] for i in range(0, len(text), max_chars)]
-            
-            offset_adjustment = 0
-            
-            for chunk in chunks:
-                response = self.client.recognize_pii_entities(
-                    documents=[chunk],
-                    language="en",
-                    categories_filter=self.config.pii_categories
-                )
-                
-                if response and response[0].entities:
-                    for entity in response[0].entities:
-                        pii_entity = PIIEntity(
-                            text=entity.text,
-                            category=entity.category,
-                            subcategory=entity.subcategory,
-                            confidence_score=entity.confidence_score,
-                            offset=entity.offset + offset_adjustment,
-                            length=entity.length
-                        )
-                        
-                        # Only include entities above confidence threshold
-                        if pii_entity.confidence_score >= self.confidence_threshold:
-                            all_entities.append(pii_entity)
-                
-                offset_adjustment += len(chunk)
-            
-            logger.info("Azure PII detection completed", 
-                       azure_entities=len(all_entities))
-            
-        except Exception as e:
-            logger.error("Azure PII detection failed", error=str(e))
+        logger.info("Azure PII detection completed", 
+                   azure_entities=len(all_entities))
         
         # ALWAYS run enhanced regex patterns as well (hybrid approach)
         regex_entities = self._fallback_detection(text)
         logger.info("Regex PII detection completed", 
                    regex_entities=len(regex_entities))
         
-        # Combine and deduplicate entities
-        combined_entities = all_entities + regex_entities
-        
-        # Remove duplicates and overlaps (keep highest confidence)
-        unique_entities = []
-        processed_ranges = []
-        
-        # Sort by confidence score (highest first)
-        for entity in sorted(combined_entities, key=lambda x: -x.confidence_score):
-            entity_range = range(entity.offset, entity.offset + entity.length)
-            
-            # Check for overlap with existing entities
-            overlap = any(
-                len(set(entity_range) & set(range(start, end))) > 0
-                for start, end in processed_ranges
-            )
-            
-            if not overlap:
-                unique_entities.append(entity)
-                processed_ranges.append((entity.offset, entity.offset + entity.length))
+        unique_entities = _resolve_entities(all_entities, regex_entities)
         
         logger.info("Hybrid PII detection completed", 
                    total_unique_entities=len(unique_entities),
@@ -169,131 +344,332 @@ class AzureAIRedactor:
         
         return unique_entities
     
-    def _fallback_detection(self, text: str) -> List[PIIEntity]:
+    def _azure_candidates(self, text: str) -> Iterator[PIIEntity]:
         """
-        Enhanced fallback PII detection using contextual regex patterns
+        Yield Azure Text Analytics entities above the confidence threshold
         
         Args:
             text: Text to analyze
             
         Returns:
-            List of detected entities using regex with context awareness
+            Iterator over entities in offset order
+        """
+        if not self._needs_azure(text):
+            return
+        
+        # Chunks go five per request; a longer text's requests run concurrently
+        # (the sync client is thread-safe), so it costs about one round-trip
+        offsets, chunks = _split_chunks(text)
+        chunks = [(0, offset, chunk) for offset, chunk in zip(offsets, chunks)]
+        batches = [
+            chunks[i:i+_AZURE_MAX_BATCH_DOCUMENTS]
+            for i in range(0, len(chunks), _AZURE_MAX_BATCH_DOCUMENTS)
+        ]
+        
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(batches), _AZURE_MAX_CONCURRENT_REQUESTS)) as executor:
+                batch_results = list(executor.map(self._recognize_batch, batches))
+        else:
+            batch_results = [self._recognize_batch(batch) for batch in batches]
+        
+        # Batches and their chunks are in text order, so entities stay in offset order
+        for batch_result in batch_results:
+            for _, entities in batch_result:
+                yield from entities
+    
+    def _needs_azure(self, text: str) -> bool:
         """
+        Check whether a text is worth sending to Azure
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            False if the local regex prefilter finds no PII candidates at all
+        """
+        if self._prefilter is None:
+            return True
+        
+        if not text or self._prefilter.has_pii_candidates(text):
+            return True
+        
+        logger.info("Skipping Azure PII detection, no local candidates", chars=len(text))
+        return False
+    
+    def _entities_from_result(self, result: Any, offset_adjustment: int) -> List[PIIEntity]:
+        """
+        Convert one Azure document result into entities above the threshold
+        
+        Args:
+            result: Azure PII result for a single document
+            offset_adjustment: Absolute offset of the chunk in the full text
+            
+        Returns:
+            Entities sorted by offset
+        """
+        if getattr(result, 'is_error', False):
+            logger.warning("Azure PII detection failed for document", error=str(result.error))
+            return []
+        
         entities = []
+        for entity in result.entities or []:
+            pii_entity = PIIEntity(
+                text=entity.text,
+                category=entity.category,
+                subcategory=entity.subcategory,
+                confidence_score=entity.confidence_score,
+                offset=entity.offset + offset_adjustment,
+                length=entity.length
+            )
+            
+            # Only include entities above confidence threshold
+            if pii_entity.confidence_score >= self.confidence_threshold:
+                entities.append(pii_entity)
         
-        for category, pattern_list in self.custom_patterns.items():
-            for pattern in pattern_list:
-                matches = pattern.finditer(text)
-                for match in matches:
-                    # For contextual patterns, extract the actual PII from the capture group
-                    if match.groups():
-                        # Use the captured group (the actual PII data)
-                        pii_text = match.group(1)
-                        # Find the position of the PII text within the full match
-                        full_match = match.group(0)
-                        pii_start = full_match.find(pii_text)
-                        offset = match.start() + pii_start
-                        length = len(pii_text)
-                    else:
-                        # Use the full match
-                        pii_text = match.group(0)
-                        offset = match.start()
-                        length = len(pii_text)
-                    
-                    # Map internal categories to Azure categories
-                    azure_category = {
-                        'credit_card': 'CreditCardNumber',
-                        'phone': 'PhoneNumber', 
-                        'ssn': 'USPersonalIdentificationNumber',
-                        'email': 'Email',
-                        'address': 'Address',
-                        'name_context': 'Person'
-                    }.get(category, category)
-                    
-                    entity = PIIEntity(
-                        text=pii_text,
-                        category=azure_category,
-                        subcategory=None,
-                        confidence_score=0.95,  # High confidence for contextual matches
-                        offset=offset,
-                        length=length
-                    )
-                    entities.append(entity)
+        # Chunks are sequential, so per-chunk ordering is enough
+        entities.sort(key=lambda x: x.offset)
+        return entities
+    
+    def _recognize_batch(self, batch: List[Tuple[int, int, str]]) -> List[Tuple[int, List[PIIEntity]]]:
+        """
+        Run one Azure call over up to five document chunks
         
-        # Remove duplicates (same text at overlapping positions)
-        unique_entities = []
-        seen_positions = set()
-        
-        for entity in sorted(entities, key=lambda x: (x.offset, -x.confidence_score)):
-            # Check for overlap with existing entities
-            entity_range = range(entity.offset, entity.offset + entity.length)
-            overlap = any(
-                pos in entity_range 
-                for existing_start, existing_end in seen_positions
-                for pos in range(existing_start, existing_end)
+        Args:
+            batch: (document index, chunk offset, chunk text) tuples
+            
+        Returns:
+            (document index, entities) pairs for every chunk that succeeded
+        """
+        try:
+            response = self.client.recognize_pii_entities(
+                documents=[chunk for _, _, chunk in batch],
+                language="en",
+                categories_filter=self.config.pii_categories
+            )
+        except Exception as e:
+            logger.error("Azure batch PII detection failed", error=str(e), documents=len(batch))
+            return []
+        
+        return [
+            (doc_index, self._entities_from_result(result, chunk_offset))
+            for (doc_index, chunk_offset, _), result in zip(batch, response)
+        ]
+    
+    def _regex_candidates(self, text: str) -> Iterator[PIIEntity]:
+        """
+        Yield matches of every custom pattern, pattern by pattern
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Iterator over (possibly overlapping, unsorted) regex entities
+        """
+        # One C-level search per distinct probe rules out whole categories
+        present = {
+            probe: re.search(probe, text) is not None
+            for probe in set(_CATEGORY_PROBES.values())
+        }
+        card_numbers = [self._iter_card_numbers(text)] if present[_CATEGORY_PROBES['credit_card']] else []
+        # _fallback_detection sorts the candidates, so they are only chained here
+        return chain(
+            *(
+                self._iter_pattern_matches(category, pattern, text)
+                for category, pattern_list in self._category_patterns.items()
+                if present.get(_CATEGORY_PROBES.get(category), True)
+                for pattern in pattern_list
+            ),
+            *card_numbers
+        )
+    
+    def _iter_pattern_matches(self, category: str, pattern: Any, text: str) -> Iterator[PIIEntity]:
+        """Yield entities for a single custom pattern in offset order"""
+        # Map internal categories to Azure categories
+        azure_category = {
+            'credit_card': 'CreditCardNumber',
+            'phone': 'PhoneNumber', 
+            'ssn': 'USPersonalIdentificationNumber',
+            'email': 'Email',
+            'address': 'Address',
+            'name_context': 'Person'
+        }.get(category, category)
+        
+        for match in pattern.finditer(text):
+            # For contextual patterns, the actual PII is the only capture group
+            if match.lastindex:
+                pii_text = match.group(1)
+                offset = match.start(1)
+                length = match.end(1) - offset
+            else:
+                # Use the full match
+                pii_text = match.group(0)
+                offset = match.start()
+                length = len(pii_text)
+            
+            yield PIIEntity(
+                text=pii_text,
+                category=azure_category,
+                subcategory=None,
+                confidence_score=0.95,  # High confidence for contextual matches
+                offset=offset,
+                length=length
             )
+    
+    def _iter_card_numbers(self, text: str) -> Iterator[PIIEntity]:
+        """Yield card-shaped numbers that pass the Luhn checksum, in offset order"""
+        for match in _CARD_CANDIDATE.finditer(text):
+            if not luhn_valid(re.sub(r'[ \-]', '', match.group())):
+                continue
             
-            if not overlap:
-                unique_entities.append(entity)
-                seen_positions.add((entity.offset, entity.offset + entity.length))
+            yield PIIEntity(
+                text=match.group(),
+                category='CreditCardNumber',
+                subcategory=None,
+                confidence_score=0.95,
+                offset=match.start(),
+                length=len(match.group())
+            )
+    
+    def _fallback_detection(self, text: str) -> List[PIIEntity]:
+        """
+        Enhanced fallback PII detection using contextual regex patterns
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            List of detected entities using regex with context awareness
+        """
+        entities = list(self._regex_candidates(text))
+        
+        # Remove duplicates (same text at overlapping positions)
+        unique_entities = _merge_intervals(
+            sorted(entities, key=lambda x: (x.offset, -x.confidence_score))
+        )
         
         logger.info("Enhanced fallback detection completed", 
                    entities=len(unique_entities),
                    categories=[e.category for e in unique_entities])
         return unique_entities
     
-    def redact_text(self, text: str, custom_redaction_map: Optional[Dict[str, str]] = None) -> RedactionResult:
+    def _redact_candidates(self, text: str, azure_candidates: Iterable[PIIEntity],
+                           custom_redaction_map: Optional[Dict[str, str]] = None) -> Tuple[str, List[PIIEntity]]:
         """
-        Redact PII entities from text
+        Merge Azure and regex candidates and redact them in one pass
         
         Args:
             text: Original text to redact
+            azure_candidates: Azure entities in offset order
             custom_redaction_map: Custom redaction patterns for categories
             
         Returns:
-            RedactionResult with original and redacted text
+            Tuple of (redacted text, redacted entities in offset order)
         """
-        entities = self.detect_pii_entities(text)
-        
-        # Default redaction patterns
-        default_redaction_map = {
-            'Person': '[NAME_REDACTED]',
-            'PersonType': '[TITLE_REDACTED]',
-            'PhoneNumber': '[PHONE_REDACTED]',
-            'Address': '[ADDRESS_REDACTED]',
-            'CreditCardNumber': '[CREDIT_CARD_REDACTED]',
-            'Email': '[EMAIL_REDACTED]',
-            'URL': '[URL_REDACTED]',
-            'IPAddress': '[IP_ADDRESS_REDACTED]',
-            'DateTime': '[DATE_REDACTED]',
-            'credit_card': '[CREDIT_CARD_REDACTED]',
-            'phone': '[PHONE_REDACTED]',
-            'ssn': '[SSN_REDACTED]',
-            'email': '[EMAIL_REDACTED]'
-        }
-        
         # Merge custom redaction map if provided
-        redaction_map = default_redaction_map.copy()
+        redaction_map = _DEFAULT_REDACTION_MAP
         if custom_redaction_map:
-            redaction_map.update(custom_redaction_map)
+            redaction_map = {**_DEFAULT_REDACTION_MAP, **custom_redaction_map}
         
-        # Sort entities by offset in reverse order to maintain positions during replacement
-        sorted_entities = sorted(entities, key=lambda x: x.offset, reverse=True)
+        # A single pending entity cannot resolve chains of overlaps (A loses to
+        # B, B loses to C, A no longer overlaps anything), so use the same
+        # confidence-ordered selection as detect_pii_entities
+        entities = _resolve_entities(azure_candidates, self._fallback_detection(text))
+        entities.sort(key=lambda x: x.offset)
         
-        redacted_text = text
-        redaction_count = 0
-        confidence_scores = {}
+        parts = []
+        cursor = 0
+        for entity in entities:
+            parts.append(text[cursor:entity.offset])
+            parts.append(redaction_token(entity.category, redaction_map))
+            cursor = entity.offset + entity.length
+        
+        parts.append(text[cursor:])
+        
+        logger.info("PII redaction completed",
+                   entities_redacted=len(entities))
+        
+        return ''.join(parts), entities
+    
+    def redact_text(self, text: str, custom_redaction_map: Optional[Dict[str, str]] = None) -> RedactionResult:
+        """
+        Redact PII entities from text
         
-        for entity in sorted_entities:
-            redaction_token = redaction_map.get(entity.category, f'[{entity.category.upper()}_REDACTED]')
+        Args:
+            text: Original text to redact
+            custom_redaction_map: Custom redaction patterns for categories
             
-            # Replace the entity in the text
-            start = entity.offset
-            end = entity.offset + entity.length
-            redacted_text = redacted_text[:start] + redaction_token + redacted_text[end:]
+        Returns:
+            RedactionResult with original and redacted text
+        """
+        redacted_text, entities = self._redact_candidates(text, self._azure_candidates(text), custom_redaction_map)
+        return self._build_result(text, redacted_text, entities)
+    
+    async def redact_text_async(self, text: str, custom_redaction_map: Optional[Dict[str, str]] = None) -> RedactionResult:
+        """
+        Redact PII entities from text without blocking the event loop
+        
+        Args:
+            text: Original text to redact
+            custom_redaction_map: Custom redaction patterns for categories
             
-            redaction_count += 1
+        Returns:
+            RedactionResult with original and redacted text
+        """
+        return await asyncio.to_thread(self.redact_text, text, custom_redaction_map)
+    
+    def redact_batch(self, texts: List[str], max_workers: int = _AZURE_MAX_CONCURRENT_REQUESTS,
+                     custom_redaction_map: Optional[Dict[str, str]] = None) -> List[RedactionResult]:
+        """
+        Redact many documents, batching and parallelising the Azure calls
+        
+        Documents are split into Azure-sized chunks, sent five per request on a
+        thread pool, and each document is then redacted with the shared regex
+        patterns and a single join.
+        
+        Args:
+            texts: Documents to redact
+            max_workers: Maximum concurrent Azure requests
+            custom_redaction_map: Custom redaction patterns for categories
             
+        Returns:
+            RedactionResult per document, in input order
+        """
+        chunks = []
+        for doc_index, text in enumerate(texts):
+            if not self._needs_azure(text):
+                continue
+            offsets, doc_chunks = _split_chunks(text)
+            chunks.extend(zip([doc_index] * len(doc_chunks), offsets, doc_chunks))
+        
+        batches = [
+            chunks[i:i+_AZURE_MAX_BATCH_DOCUMENTS]
+            for i in range(0, len(chunks), _AZURE_MAX_BATCH_DOCUMENTS)
+        ]
+        
+        azure_entities = [[] for _ in texts]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_result in executor.map(self._recognize_batch, batches):
+                for doc_index, entities in batch_result:
+                    azure_entities[doc_index].extend(entities)
+        
+        results = []
+        for text, entities in zip(texts, azure_entities):
+            entities.sort(key=lambda x: x.offset)
+            redacted_text, redacted = self._redact_candidates(text, entities, custom_redaction_map)
+            results.append(self._build_result(text, redacted_text, redacted))
+        
+        logger.info("Batch redaction completed",
+                   documents=len(texts),
+                   azure_requests=len(batches))
+        
+        return results
+    
+    def _build_result(self, text: str, redacted_text: str, entities: List[PIIEntity]) -> RedactionResult:
+        """Assemble a RedactionResult with per-category average confidence"""
+        redaction_count = len(entities)
+        confidence_scores = {}
+        
+        for entity in entities:
             # Track confidence scores by category
             if entity.category not in confidence_scores:
                 confidence_scores[entity.category] = []
@@ -308,7 +684,7 @@ class AzureAIRedactor:
         result = RedactionResult(
             original_text=text,
             redacted_text=redacted_text,
-            entities_found=entities,
+            entities_found=tuple(entities),
             redaction_count=redaction_count,
             confidence_scores=avg_confidence_scores
         )
@@ -320,44 +696,35 @@ class AzureAIRedactor:
         
         return result
     
-    def analyze_document_risk(self, text: str) -> Dict[str, Any]:
+    def analyze_document_risk(self, text: str, entities: Optional[Iterable[PIIEntity]] = None) -> Dict[str, Any]:
         """
         Analyze document for PII risk assessment
         
         Args:
             text: Document text to analyze
+            entities: Entities already detected in text (e.g. RedactionResult.entities_found);
+                detection runs again only if None
             
         Returns:
             Risk analysis report
         """
-        entities = self.detect_pii_entities(text)
+        if entities is None:
+            entities = self.detect_pii_entities(text)
+        entities = list(entities)
         
         # Count entities by category
-        category_counts = {}
+        category_counts = dict(Counter(entity.category for entity in entities))
         high_risk_entities = []
         
         for entity in entities:
-            category = entity.category
-            if category not in category_counts:
-                category_counts[category] = 0
-            category_counts[category] += 1
-            
             # High-risk entities (low confidence or sensitive categories)
             if (entity.confidence_score < 0.7 or 
-                entity.category in ['CreditCardNumber', 'PhoneNumber', 'Address']):
+                entity.category in _HIGH_RISK_CATEGORIES):
                 high_risk_entities.append(entity)
         
         # Calculate risk score
-        risk_multipliers = {
-            'CreditCardNumber': 5,
-            'PhoneNumber': 3,
-            'Address': 4,
-            'Person': 2,
-            'Email': 2
-        }
-        
         risk_score = sum(
-            count * risk_multipliers.get(category, 1)
+            count * _RISK_MULTIPLIERS.get(category, 1)
             for category, count in category_counts.items()
         )
         
@@ -4,14 +4,55 @@ Handles Azure credentials and service connections
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.ai.textanalytics import TextAnalyticsClient
-from azure.core.credentials import AzureKeyCredential
-import structlog
 
-logger = structlog.get_logger(__name__)
+from logging_compat import get_logger
+
+if TYPE_CHECKING:
+    from azure.ai.textanalytics import TextAnalyticsClient
+
+logger = get_logger(__name__)
+
+@lru_cache(maxsize=None)
+def _create_text_analytics_client(endpoint: str,
+                                  key: Optional[str],
+                                  tenant_id: Optional[str],
+                                  client_id: Optional[str],
+                                  client_secret: Optional[str]) -> "TextAnalyticsClient":
+    """
+    Create a Text Analytics client, cached per endpoint and credential set
+    
+    Sharing one client per process keeps its HTTP pipeline (and the pooled
+    keep-alive connections) alive across redactors and requests.
+    """
+    # Imported lazily: the Azure SDK (and MSAL behind azure.identity) is slow to load
+    from azure.ai.textanalytics import TextAnalyticsClient
+    from azure.core.credentials import AzureKeyCredential
+    from azure.identity import DefaultAzureCredential, ClientSecretCredential
+    
+    if key:
+        # Use API key authentication
+        credential = AzureKeyCredential(key)
+        logger.info("Using API key authentication for Text Analytics")
+    else:
+        # Use managed identity or service principal
+        if all([tenant_id, client_id, client_secret]):
+            credential = ClientSecretCredential(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                client_secret=client_secret
+            )
+            logger.info("Using service principal authentication")
+        else:
+            credential = DefaultAzureCredential()
+            logger.info("Using default Azure credential")
+    
+    return TextAnalyticsClient(
+        endpoint=endpoint,
+        credential=credential
+    )
 
 class AzureConfig:
     """Azure AI services configuration manager"""
@@ -42,15 +83,19 @@ class AzureConfig:
         
         self.confidence_threshold = float(os.getenv('REDACTION_CONFIDENCE_THRESHOLD', '0.8'))
         self.pii_categories = os.getenv('PII_CATEGORIES', 'Person,PhoneNumber,Address,CreditCardNumber,Email').split(',')
+        self.regex_engine = os.getenv('REDACTION_REGEX_ENGINE', 're').lower()
+        # Opt-in: with the prefilter on, entities only Azure finds (lowercase or
+        # single names, dates, URLs) go unredacted in texts the regexes pass over
+        self.azure_prefilter = os.getenv('REDACTION_AZURE_PREFILTER', 'false').lower() in ('1', 'true', 'yes')
         
         logger.info("Azure configuration loaded", 
                    endpoint=self.text_analytics_endpoint,
                    categories=self.pii_categories,
                    threshold=self.confidence_threshold)
     
-    def get_text_analytics_client(self) -> TextAnalyticsClient:
+    def get_text_analytics_client(self) -> "TextAnalyticsClient":
         """
-        Create and return Azure Text Analytics client
+        Return the shared Azure Text Analytics client for this configuration
         
         Returns:
             TextAnalyticsClient instance
@@ -58,26 +103,12 @@ class AzureConfig:
         if not self.text_analytics_endpoint:
             raise ValueError("AZURE_TEXT_ANALYTICS_ENDPOINT not configured")
         
-        if self.text_analytics_key:
-            # Use API key authentication
-            credential = AzureKeyCredential(self.text_analytics_key)
-            logger.info("Using API key authentication for Text Analytics")
-        else:
-            # Use managed identity or service principal
-            if all([self.tenant_id, self.client_id, self.client_secret]):
-                credential = ClientSecretCredential(
-                    tenant_id=self.tenant_id,
-                    client_id=self.client_id,
-                    client_secret=self.client_secret
-                )
-                logger.info("Using service principal authentication")
-            else:
-                credential = DefaultAzureCredential()
-                logger.info("Using default Azure credential")
-        
-        return TextAnalyticsClient(
-            endpoint=self.text_analytics_endpoint,
-            credential=credential
+        return _create_text_analytics_client(
+            self.text_analytics_endpoint,
+            self.text_analytics_key,
+            self.tenant_id,
+            self.client_id,
+            self.client_secret
         )
     
     def validate_configuration(self) -> bool:
@@ -107,3 +138,16 @@ class AzureConfig:
         
         logger.info("Configuration validation passed")
         return True
+
+@lru_cache(maxsize=None)
+def get_config(env_file: Optional[str] = None) -> AzureConfig:
+    """
+    Return the process-wide configuration for an env file
+    
+    Args:
+        env_file: Path to .env file (optional)
+        
+    Returns:
+        Cached AzureConfig instance
+    """
+    return AzureConfig(env_file)
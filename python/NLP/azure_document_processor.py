@@ -4,39 +4,239 @@ Handles DOCX and PDF files with intelligent redaction
 """
 
 import os
+import mmap
 import sys
-from typing import Optional, Dict, Any
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from docx import Document
-from docx.shared import RGBColor
-from docx.enum.text import WD_COLOR_INDEX
-import PyPDF2
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-import structlog
+# python-docx, PyPDF2/pypdfium2 and reportlab are imported inside the functions
+# that use them, so importing this module (and CLI cold starts) stays cheap
+from azure_ai_redactor import AzureAIRedactor, RedactionResult, redaction_token
+import azure_config
+from azure_config import AzureConfig, get_config
+from logging_compat import get_logger
 
-from azure_ai_redactor import AzureAIRedactor, RedactionResult
-from azure_config import AzureConfig
+logger = get_logger(__name__)
 
-logger = structlog.get_logger(__name__)
+# Azure Text Analytics accepts five documents per request
+_BATCH_GROUP_SIZE = 5
+
+def _extract_pdf_pages(input_path: str) -> List[str]:
+    """
+    Extract the text of every PDF page
+    
+    Uses PDFium (native, releases the GIL) when pypdfium2 is installed and
+    falls back to PyPDF2 otherwise.
+    
+    Args:
+        input_path: Path to input PDF file
+        
+    Returns:
+        Text per page
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+    
+    if pdfium is None:
+        import PyPDF2
+        
+        # Map the file so PyPDF2's many small seeks and reads hit the page cache
+        # directly instead of going through read() syscalls and buffer copies
+        with open(input_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return [page.extract_text() for page in PyPDF2.PdfReader(mapped).pages]
+    
+    # PDFium reads the file natively, without Python-level copies
+    pdf = pdfium.PdfDocument(input_path)
+    try:
+        # PDFium terminates lines with CRLF; normalise to match the rest of the pipeline
+        return [page.get_textpage().get_text_range().replace('\r\n', '\n') for page in pdf]
+    finally:
+        pdf.close()
+
+def _collect_runs(paragraphs) -> Tuple[str, List[int], List[Any]]:
+    """
+    Flatten the runs of a list of paragraphs into one text buffer
+    
+    Args:
+        paragraphs: python-docx paragraphs (doc.paragraphs rebuilds its list on every access)
+        
+    Returns:
+        Tuple of (full text with one newline per paragraph, start offset of each run, runs)
+    """
+    parts = []
+    run_starts = []
+    runs = []
+    position = 0
+    
+    for paragraph in paragraphs:
+        # Hyperlinks hold their own runs; include them so linked text is scanned too
+        for item in paragraph.iter_inner_content():
+            for run in (item.runs if hasattr(item, 'runs') else [item]):
+                run_starts.append(position)
+                runs.append(run)
+                parts.append(run.text)
+                position += len(run.text)
+        parts.append("\n")
+        position += 1
+    
+    return "".join(parts), run_starts, runs
+
+def _redact_runs(run_starts: List[int], runs: List[Any], entities) -> int:
+    """
+    Replace entity text inside the runs that contain it, keeping run formatting
+    
+    Args:
+        run_starts: Start offset of each run in the flattened text
+        runs: Runs aligned with run_starts
+        entities: Non-overlapping entities with offsets into the flattened text
+        
+    Returns:
+        Number of runs modified
+    """
+    from docx.shared import RGBColor
+    from docx.enum.text import WD_COLOR_INDEX
+    
+    edits: Dict[int, List[Tuple[int, int, str]]] = {}
+    
+    for entity in entities:
+        start = entity.offset
+        end = entity.offset + entity.length
+        token = redaction_token(entity.category)
+        
+        # An entity may span several runs: the token goes in the first, the rest is trimmed
+        idx = max(bisect_right(run_starts, start) - 1, 0)
+        while idx < len(runs) and run_starts[idx] < end:
+            run_length = len(runs[idx].text)
+            local_start = max(start - run_starts[idx], 0)
+            local_end = min(end - run_starts[idx], run_length)
+            if local_start < local_end:
+                edits.setdefault(idx, []).append((local_start, local_end, token))
+                token = ''
+            idx += 1
+    
+    for idx, run_edits in edits.items():
+        run = runs[idx]
+        run_text = run.text
+        # Apply right to left so earlier local offsets stay valid
+        for local_start, local_end, token in reversed(run_edits):
+            run_text = run_text[:local_start] + token + run_text[local_end:]
+        run.text = run_text
+        
+        if any(token for _, _, token in run_edits):
+            run.font.highlight_color = WD_COLOR_INDEX.YELLOW
+            run.font.color.rgb = RGBColor(255, 0, 0)  # Red text
+    
+    return len(edits)
+
+def _write_redacted_pdf(output_path: str, redacted_text: str, redaction_count: int) -> None:
+    """
+    Stream redacted text straight onto PDF pages
+    
+    Draws wrapped lines with a canvas text object instead of building a
+    Platypus story, so only the current page is held in memory.
+    
+    Args:
+        output_path: Path to output PDF file
+        redacted_text: Redacted document text
+        redaction_count: Number of redactions, shown in the header
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen import canvas
+    
+    page_width, page_height = letter
+    left = 1.5 * inch
+    top = page_height - inch
+    bottom = inch
+    text_width = page_width - 2 * left
+    font_name, font_size, leading = 'Helvetica', 10, 12
+    
+    pdf = canvas.Canvas(output_path, pagesize=letter)
+    
+    # Redaction header
+    pdf.setFillColorRGB(1, 0, 0)
+    pdf.setFont('Helvetica-Bold', 14)
+    pdf.drawCentredString(page_width / 2, top,
+                          f"🔒 DOCUMENT REDACTED - {redaction_count} entities redacted")
+    pdf.setFillColorRGB(0, 0, 0)
+    
+    text = pdf.beginText(left, top - 40)
+    text.setFont(font_name, font_size, leading)
+    
+    for para in redacted_text.split('\n'):
+        if not para.strip():
+            continue
+        
+        for line in simpleSplit(para, font_name, font_size, text_width):
+            if text.getY() < bottom:
+                pdf.drawText(text)
+                pdf.showPage()
+                text = pdf.beginText(left, top)
+                text.setFont(font_name, font_size, leading)
+            text.textLine(line)
+        
+        # Paragraph spacing
+        text.moveCursor(0, leading)
+    
+    pdf.drawText(text)
+    pdf.save()
+
+def _build_results(input_path: str, output_path: str, full_text: str,
+                   redaction_result: RedactionResult, risk_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Assemble the per-file processing report
+    
+    Args:
+        input_path: Path to input document
+        output_path: Path to output document
+        full_text: Extracted document text
+        redaction_result: Redaction result for full_text
+        risk_analysis: Risk analysis report
+        
+    Returns:
+        Processing results and statistics
+    """
+    return {
+        'status': 'success',
+        'input_file': input_path,
+        'output_file': output_path,
+        'original_length': len(full_text),
+        'redacted_length': len(redaction_result.redacted_text),
+        'entities_found': len(redaction_result.entities_found),
+        'redactions_made': redaction_result.redaction_count,
+        'confidence_scores': redaction_result.confidence_scores,
+        'risk_analysis': risk_analysis,
+        'entity_details': [
+            {
+                'text': entity.text,
+                'category': entity.category,
+                'confidence': entity.confidence_score
+            }
+            for entity in redaction_result.entities_found
+        ]
+    }
 
 class AzureDocxProcessor:
     """DOCX processor with Azure AI redaction capabilities"""
     
-    def __init__(self, config: Optional[AzureConfig] = None):
+    def __init__(self, config: Optional[AzureConfig] = None, redactor: Optional[AzureAIRedactor] = None):
         """
         Initialize DOCX processor with Azure AI
         
         Args:
             config: Azure configuration
+            redactor: Shared redactor (a new one is created from config if None)
         """
-        self.redactor = AzureAIRedactor(config)
+        self.redactor = redactor or AzureAIRedactor(config)
         logger.info("Azure DOCX processor initialized")
     
     def process_document(self, input_path: str, output_path: str) -> Dict[str, Any]:
@@ -51,97 +251,101 @@ class AzureDocxProcessor:
             Processing results and statistics
         """
         try:
-            # Load document
-            doc = Document(input_path)
-            
-            # Extract all text content
-            full_text = ""
-            paragraph_texts = []
-            
-            for paragraph in doc.paragraphs:
-                para_text = paragraph.text
-                paragraph_texts.append(para_text)
-                full_text += para_text + "\n"
-            
-            logger.info("Document loaded", 
-                       paragraphs=len(paragraph_texts),
-                       total_chars=len(full_text))
+            full_text, loaded = self.load_document(input_path)
             
             # Perform Azure AI redaction on full text
             redaction_result = self.redactor.redact_text(full_text)
             
-            # Split redacted text back into paragraphs
-            redacted_paragraphs = redaction_result.redacted_text.split('\n')
-            
-            # Apply redactions to document
-            for i, paragraph in enumerate(doc.paragraphs):
-                if i < len(redacted_paragraphs):
-                    # Clear existing text
-                    paragraph.clear()
-                    
-                    # Add redacted text with formatting
-                    run = paragraph.add_run(redacted_paragraphs[i])
-                    
-                    # Highlight redacted content
-                    if '[' in redacted_paragraphs[i] and '_REDACTED]' in redacted_paragraphs[i]:
-                        run.font.highlight_color = WD_COLOR_INDEX.YELLOW
-                        run.font.color.rgb = RGBColor(255, 0, 0)  # Red text
-            
-            # Add redaction summary at the beginning
-            summary_paragraph = doc.paragraphs[0]
-            summary_paragraph.insert_paragraph_before(
-                f"🔒 DOCUMENT REDACTED - {redaction_result.redaction_count} entities redacted"
-            ).runs[0].font.bold = True
-            
-            # Save redacted document
-            doc.save(output_path)
-            
-            # Analyze document risk
-            risk_analysis = self.redactor.analyze_document_risk(full_text)
+            return self.save_document(loaded, redaction_result, input_path, output_path)
             
-            results = {
-                'status': 'success',
-                'input_file': input_path,
-                'output_file': output_path,
-                'original_length': len(full_text),
-                'redacted_length': len(redaction_result.redacted_text),
-                'entities_found': len(redaction_result.entities_found),
-                'redactions_made': redaction_result.redaction_count,
-                'confidence_scores': redaction_result.confidence_scores,
-                'risk_analysis': risk_analysis,
-                'entity_details': [
-                    {
-                        'text': entity.text,
-                        'category': entity.category,
-                        'confidence': entity.confidence_score
-                    }
-                    for entity in redaction_result.entities_found
-                ]
-            }
+        except Exception as e:
+            return self.error_result(input_path, e)
+    
+    def load_document(self, input_path: str) -> Tuple[str, Any]:
+        """
+        Load a DOCX file and flatten its text
+        
+        Args:
+            input_path: Path to input DOCX file
             
-            logger.info("DOCX processing completed", results=results)
-            return results
+        Returns:
+            Tuple of (full text, loaded state for save_document)
+        """
+        from docx import Document
+        
+        doc = Document(input_path)
+        
+        # Extract all text content, remembering where each run sits
+        paragraphs = doc.paragraphs
+        full_text, run_starts, runs = _collect_runs(paragraphs)
+        
+        logger.info("Document loaded", 
+                   paragraphs=len(paragraphs),
+                   runs=len(runs),
+                   total_chars=len(full_text))
+        
+        return full_text, (doc, paragraphs, full_text, run_starts, runs)
+    
+    def save_document(self, loaded: Any, redaction_result: RedactionResult,
+                      input_path: str, output_path: str) -> Dict[str, Any]:
+        """
+        Apply a redaction result to a loaded DOCX file and save it
+        
+        Args:
+            loaded: State returned by load_document
+            redaction_result: Redaction result for the document's full text
+            input_path: Path to input DOCX file
+            output_path: Path to output redacted DOCX file
             
-        except Exception as e:
-            error_msg = f"Error processing DOCX: {str(e)}"
-            logger.error("DOCX processing failed", error=error_msg)
-            return {
-                'status': 'error',
-                'error': error_msg,
-                'input_file': input_path
-            }
+        Returns:
+            Processing results and statistics
+        """
+        doc, paragraphs, full_text, run_starts, runs = loaded
+        
+        # Analyze document risk from the entities already found
+        risk_analysis = self.redactor.analyze_document_risk(
+            full_text, entities=redaction_result.entities_found
+        )
+        
+        # Rewrite only the runs that contain entities
+        _redact_runs(run_starts, runs, redaction_result.entities_found)
+        
+        # Add redaction summary at the beginning
+        summary_paragraph = paragraphs[0]
+        summary_paragraph.insert_paragraph_before(
+            f"🔒 DOCUMENT REDACTED - {redaction_result.redaction_count} entities redacted"
+        ).runs[0].font.bold = True
+        
+        # Save redacted document
+        doc.save(output_path)
+        
+        results = _build_results(input_path, output_path, full_text, redaction_result, risk_analysis)
+        
+        logger.info("DOCX processing completed", results=results)
+        return results
+    
+    def error_result(self, input_path: str, error: Exception) -> Dict[str, Any]:
+        """Build the error report for a DOCX file that could not be processed"""
+        error_msg = f"Error processing DOCX: {str(error)}"
+        logger.error("DOCX processing failed", error=error_msg)
+        return {
+            'status': 'error',
+            'error': error_msg,
+            'input_file': input_path
+        }
 
 class AzurePdfProcessor:
     """PDF processor with Azure AI redaction capabilities"""
     
-    def __init__(self, config: Optional[AzureConfig] = None):
+    def __init__(self, config: Optional[AzureConfig] = None, redactor: Optional[AzureAIRedactor] = None):
         """
         Initialize PDF processor with Azure AI
         
         Args:
             config: Azure configuration
+            redactor: Shared redactor (a new one is created from config if None)
         """
-        self.redactor = AzureAIRedactor(config)
+        self.redactor = redactor or AzureAIRedactor(config)
         logger.info("Azure PDF processor initialized")
     
     def process_document(self, input_path: str, output_path: str) -> Dict[str, Any]:
@@ -156,97 +360,101 @@ class AzurePdfProcessor:
             Processing results and statistics
         """
         try:
-            # Extract text from PDF
-            full_text = ""
-            with open(input_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num, page in enumerate(pdf_reader.pages):
-                    page_text = page.extract_text()
-                    full_text += page_text + "\n"
-            
-            logger.info("PDF text extracted", 
-                       pages=len(pdf_reader.pages),
-                       total_chars=len(full_text))
+            full_text, loaded = self.load_document(input_path)
             
             # Perform Azure AI redaction
             redaction_result = self.redactor.redact_text(full_text)
             
-            # Create new PDF with redacted content
-            doc = SimpleDocTemplate(output_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            
-            # Custom style for redacted content
-            redacted_style = ParagraphStyle(
-                'RedactedContent',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=12,
-                leftIndent=0.5*inch,
-                rightIndent=0.5*inch
-            )
-            
-            story = []
-            
-            # Add redaction header
-            header_style = ParagraphStyle(
-                'RedactionHeader',
-                parent=styles['Title'],
-                fontSize=14,
-                spaceAfter=20,
-                textColor='red'
-            )
-            
-            story.append(Paragraph(
-                f"🔒 DOCUMENT REDACTED - {redaction_result.redaction_count} entities redacted",
-                header_style
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Add redacted content
-            paragraphs = redaction_result.redacted_text.split('\n')
-            for para in paragraphs:
-                if para.strip():
-                    story.append(Paragraph(para, redacted_style))
-                    story.append(Spacer(1, 6))
+            return self.save_document(loaded, redaction_result, input_path, output_path)
             
-            # Build PDF
-            doc.build(story)
-            
-            # Analyze document risk
-            risk_analysis = self.redactor.analyze_document_risk(full_text)
-            
-            results = {
-                'status': 'success',
-                'input_file': input_path,
-                'output_file': output_path,
-                'original_length': len(full_text),
-                'redacted_length': len(redaction_result.redacted_text),
-                'entities_found': len(redaction_result.entities_found),
-                'redactions_made': redaction_result.redaction_count,
-                'confidence_scores': redaction_result.confidence_scores,
-                'risk_analysis': risk_analysis,
-                'entity_details': [
-                    {
-                        'text': entity.text,
-                        'category': entity.category,
-                        'confidence': entity.confidence_score
-                    }
-                    for entity in redaction_result.entities_found
-                ]
-            }
+        except Exception as e:
+            return self.error_result(input_path, e)
+    
+    def load_document(self, input_path: str) -> Tuple[str, Any]:
+        """
+        Extract the text of a PDF file
+        
+        Args:
+            input_path: Path to input PDF file
             
-            logger.info("PDF processing completed", results=results)
-            return results
+        Returns:
+            Tuple of (full text, loaded state for save_document)
+        """
+        page_texts = _extract_pdf_pages(input_path)
+        full_text = "".join(page_text + "\n" for page_text in page_texts)
+        
+        logger.info("PDF text extracted", 
+                   pages=len(page_texts),
+                   total_chars=len(full_text))
+        
+        return full_text, full_text
+    
+    def save_document(self, loaded: Any, redaction_result: RedactionResult,
+                      input_path: str, output_path: str) -> Dict[str, Any]:
+        """
+        Write a redacted PDF for a loaded document
+        
+        Args:
+            loaded: State returned by load_document
+            redaction_result: Redaction result for the document's full text
+            input_path: Path to input PDF file
+            output_path: Path to output redacted PDF file
             
-        except Exception as e:
-            error_msg = f"Error processing PDF: {str(e)}"
-            logger.error("PDF processing failed", error=error_msg)
-            return {
-                'status': 'error',
-                'error': error_msg,
-                'input_file': input_path
-            }
+        Returns:
+            Processing results and statistics
+        """
+        full_text = loaded
+        
+        # Analyze document risk from the entities already found
+        risk_analysis = self.redactor.analyze_document_risk(
+            full_text, entities=redaction_result.entities_found
+        )
+        
+        # Create new PDF with redacted content
+        _write_redacted_pdf(output_path, redaction_result.redacted_text, redaction_result.redaction_count)
+        
+        results = _build_results(input_path, output_path, full_text, redaction_result, risk_analysis)
+        
+        logger.info("PDF processing completed", results=results)
+        return results
+    
+    def error_result(self, input_path: str, error: Exception) -> Dict[str, Any]:
+        """Build the error report for a PDF file that could not be processed"""
+        error_msg = f"Error processing PDF: {str(error)}"
+        logger.error("PDF processing failed", error=error_msg)
+        return {
+            'status': 'error',
+            'error': error_msg,
+            'input_file': input_path
+        }
+
+# Per-process processor for batch workers, built once by _init_worker
+_worker_processor: Optional["AzureDocumentProcessor"] = None
+
+def _init_worker(config: AzureConfig) -> None:
+    """
+    Build the worker process's document processor
+    
+    Args:
+        config: Azure configuration (SDK clients are not picklable, so each worker builds its own)
+    """
+    global _worker_processor
+    # Forked workers inherit the parent's cached client and its open connections
+    azure_config._create_text_analytics_client.cache_clear()
+    get_config.cache_clear()
+    _worker_processor = AzureDocumentProcessor(config)
+
+def _process_group(pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Process a group of documents in a worker process
+    
+    Args:
+        pairs: (input path, output path) per document
+        
+    Returns:
+        Processing results, in input order
+    """
+    return _worker_processor.process_group(pairs)
 
 class AzureDocumentProcessor:
     """Main document processor that handles both DOCX and PDF files"""
@@ -258,9 +466,11 @@ class AzureDocumentProcessor:
         Args:
             config: Azure configuration
         """
-        self.config = config or AzureConfig()
-        self.docx_processor = AzureDocxProcessor(self.config)
-        self.pdf_processor = AzurePdfProcessor(self.config)
+        self.config = config or get_config()
+        # One redactor (and its compiled patterns and client) serves both file types
+        self._redactor = AzureAIRedactor(self.config)
+        self.docx_processor = AzureDocxProcessor(self.config, self._redactor)
+        self.pdf_processor = AzurePdfProcessor(self.config, self._redactor)
         
         logger.info("Azure document processor initialized")
     
@@ -288,26 +498,81 @@ class AzureDocumentProcessor:
             output_path = str(input_file.parent / f"azure_redacted_{input_file.name}")
         
         # Determine file type and process accordingly
-        file_extension = input_file.suffix.lower()
+        processor = self._processor_for(input_path)
+        if processor is None:
+            return self._unsupported_result(input_path)
+        
+        return processor.process_document(input_path, output_path)
+    
+    def _processor_for(self, input_path: str):
+        """Return the sub-processor for a file, or None if its type is unsupported"""
+        file_extension = Path(input_path).suffix.lower()
         
         if file_extension == '.docx':
-            return self.docx_processor.process_document(input_path, output_path)
+            return self.docx_processor
         elif file_extension == '.pdf':
-            return self.pdf_processor.process_document(input_path, output_path)
-        else:
-            return {
-                'status': 'error',
-                'error': f'Unsupported file type: {file_extension}',
-                'supported_types': ['.docx', '.pdf']
-            }
+            return self.pdf_processor
+        return None
+    
+    def _unsupported_result(self, input_path: str) -> Dict[str, Any]:
+        """Build the error report for an unsupported file type"""
+        return {
+            'status': 'error',
+            'error': f'Unsupported file type: {Path(input_path).suffix.lower()}',
+            'supported_types': ['.docx', '.pdf']
+        }
+    
+    def process_group(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Process several documents with shared, batched Azure requests
+        
+        Every document is loaded first, then all texts go through one
+        redact_batch call (up to five chunks per request), and each document
+        is saved from its own result.
+        
+        Args:
+            pairs: (input path, output path) per document
+            
+        Returns:
+            Processing results, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+        loaded = []
+        
+        for index, (input_path, output_path) in enumerate(pairs):
+            processor = self._processor_for(input_path)
+            if processor is None:
+                results[index] = self._unsupported_result(input_path)
+                continue
+            
+            try:
+                full_text, state = processor.load_document(input_path)
+            except Exception as e:
+                results[index] = processor.error_result(input_path, e)
+                continue
+            
+            loaded.append((index, processor, full_text, state))
+        
+        redaction_results = self._redactor.redact_batch([full_text for _, _, full_text, _ in loaded])
+        
+        for (index, processor, _, state), redaction_result in zip(loaded, redaction_results):
+            input_path, output_path = pairs[index]
+            try:
+                results[index] = processor.save_document(state, redaction_result, input_path, output_path)
+            except Exception as e:
+                results[index] = processor.error_result(input_path, e)
+        
+        return results
     
-    def batch_process(self, input_directory: str, output_directory: Optional[str] = None) -> Dict[str, Any]:
+    def batch_process(self, input_directory: str, output_directory: Optional[str] = None,
+                      max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Process multiple documents in a directory
         
         Args:
             input_directory: Directory containing input documents
             output_directory: Directory for output documents
+            max_workers: Worker processes to use (defaults to min(8, CPU count))
             
         Returns:
             Batch processing results
@@ -326,27 +591,39 @@ class AzureDocumentProcessor:
         output_dir = Path(output_directory)
         output_dir.mkdir(exist_ok=True)
         
-        # Find supported documents
-        supported_extensions = ['.docx', '.pdf']
-        documents = []
+        # Find supported documents in a single directory scan
+        supported_extensions = {'.docx', '.pdf'}
+        with os.scandir(input_dir) as entries:
+            documents = sorted(
+                Path(entry.path) for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in supported_extensions
+            )
         
-        for ext in supported_extensions:
-            documents.extend(input_dir.glob(f'*{ext}'))
+        pairs = [(str(doc_path), str(output_dir / f"azure_redacted_{doc_path.name}")) for doc_path in documents]
         
-        results = []
-        success_count = 0
-        error_count = 0
+        # Files are redacted in groups that share batched Azure requests
+        groups = [
+            pairs[i:i+_BATCH_GROUP_SIZE]
+            for i in range(0, len(pairs), _BATCH_GROUP_SIZE)
+        ]
         
-        for doc_path in documents:
-            output_path = str(output_dir / f"azure_redacted_{doc_path.name}")
-            result = self.process_file(str(doc_path), output_path)
-            
-            results.append(result)
-            
-            if result['status'] == 'success':
-                success_count += 1
-            else:
-                error_count += 1
+        if len(groups) <= 1:
+            # Not worth spinning up a process pool for a single group
+            results = self.process_group(pairs)
+        else:
+            # Parsing and Azure round-trips are independent per group, so fan out across processes
+            max_workers = max_workers or min(8, os.cpu_count() or 1)
+            # Each worker builds its redactor (and Azure client) once, not once per group
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(self.config,)) as executor:
+                results = [
+                    result
+                    for group_results in executor.map(_process_group, groups)
+                    for result in group_results
+                ]
+        
+        success_count = sum(1 for result in results if result['status'] == 'success')
+        error_count = len(results) - success_count
         
         batch_results = {
             'status': 'completed',
@@ -10,9 +10,9 @@ import PyPDF2
 # Add the current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from azure_config import AzureConfig
+from azure_config import get_config
 from azure_ai_redactor import AzureAIRedactor
-from demo_redactor import DemoAzureAIRedactor
+from demo_redactor import get_demo_redactor
 
 def debug_pdf_content():
     """Extract and debug PDF content"""
@@ -44,7 +44,7 @@ def debug_pdf_content():
     
     # Test with Azure AI (if configured)
     try:
-        config = AzureConfig()
+        config = get_config()
         if config.validate_configuration():
             print("\n🤖 Testing with Azure Text Analytics...")
             redactor = AzureAIRedactor(config)
@@ -61,7 +61,7 @@ def debug_pdf_content():
     
     # Test with demo patterns
     print("\n🔧 Testing with enhanced demo patterns...")
-    demo_redactor = DemoAzureAIRedactor()
+    demo_redactor = get_demo_redactor()
     demo_entities = demo_redactor.detect_pii_entities(full_text)
     
     print(f"Demo patterns found {len(demo_entities)} entities:")
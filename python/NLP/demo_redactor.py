@@ -3,14 +3,54 @@ Demo Mode Azure AI Redactor
 Demonstrates functionality using regex patterns when Azure credentials are not available
 """
 
+import os
 import re
-from typing import List, Dict, Optional, Any
+import hashlib
+import tempfile
+import threading
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
-import structlog
+from pathlib import Path
 
-logger = structlog.get_logger(__name__)
+from logging_compat import get_logger
+from pii_hot import luhn_valid, resolve_overlaps
 
-@dataclass
+logger = get_logger(__name__)
+
+# Default redaction patterns
+_DEFAULT_REDACTION_MAP = MappingProxyType({
+    'Person': '[NAME_REDACTED]',
+    'PersonType': '[TITLE_REDACTED]',
+    'PhoneNumber': '[PHONE_REDACTED]',
+    'Address': '[ADDRESS_REDACTED]',
+    'CreditCardNumber': '[CREDIT_CARD_REDACTED]',
+    'Email': '[EMAIL_REDACTED]',
+    'IPAddress': '[IP_ADDRESS_REDACTED]'
+})
+
+# Risk weights per category (anything else counts once)
+_RISK_MULTIPLIERS = MappingProxyType({
+    'CreditCardNumber': 5,
+    'PhoneNumber': 3,
+    'Address': 4,
+    'Person': 2,
+    'Email': 2
+})
+
+_HIGH_RISK_CATEGORIES = frozenset({'CreditCardNumber', 'PhoneNumber', 'Address'})
+
+# Serialized Hyperscan databases, keyed by pattern set, so short-lived CLI
+# runs skip the compile step
+_HS_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'radact'
+
+# Characters on which Hyperscan's or RE2's classes disagree with Python's:
+# anything non-ASCII, plus \v and the \x1c-\x1f separators (\s to Python only)
+_FAST_SCAN_UNSAFE = re.compile(r'[^\x00-\x0a\x0c-\x1b\x20-\x7f]')
+
+@dataclass(slots=True)
 class DemoPIIEntity:
     """Demo version of PII entity"""
     text: str
@@ -20,7 +60,7 @@ class DemoPIIEntity:
     offset: int
     length: int
 
-@dataclass
+@dataclass(slots=True)
 class DemoRedactionResult:
     """Demo version of redaction result"""
     original_text: str
@@ -29,6 +69,96 @@ class DemoRedactionResult:
     redaction_count: int
     confidence_scores: Dict[str, float]
 
+@lru_cache(maxsize=None)
+def _load_hyperscan():
+    """Return the hyperscan module, or None when it is not installed"""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    return hyperscan
+
+@lru_cache(maxsize=None)
+def _load_re2():
+    """Return the re2 module (google-re2), or None when it is not installed"""
+    try:
+        import re2
+    except ImportError:
+        return None
+    return re2
+
+def _hs_cache_path(expressions: List[bytes], flags: List[int]) -> Path:
+    """Cache file for a Hyperscan database built from these expressions and flags"""
+    hyperscan = _load_hyperscan()
+    digest = hashlib.sha256(hyperscan.__version__.encode('ascii'))
+    for expression, pattern_flags in zip(expressions, flags):
+        digest.update(b'%d:%d:%s\0' % (pattern_flags, len(expression), expression))
+    return _HS_CACHE_DIR / f'patterns-{digest.hexdigest()[:32]}.hsdb'
+
+def _load_hyperscan_cache(path: Path) -> Optional[Any]:
+    """Load a cached block-mode database, or None if it is missing or unusable"""
+    hyperscan = _load_hyperscan()
+    try:
+        db = hyperscan.loadb(path.read_bytes(), hyperscan.HS_MODE_BLOCK)
+        # Deserialized databases come without scratch space
+        db.scratch = hyperscan.Scratch(db)
+    except (OSError, hyperscan.error) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning("Ignoring unusable Hyperscan cache", path=str(path), error=str(e))
+        return None
+    return db
+
+def _store_hyperscan_cache(path: Path, db: Any) -> None:
+    """Write a database to the cache; concurrent writers each replace the file atomically"""
+    hyperscan = _load_hyperscan()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(hyperscan.dumpb(db))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache Hyperscan database", path=str(path), error=str(e))
+
+def _compile_re2(pattern: str) -> Any:
+    """Compile a pattern with RE2, bounding the memory its DFA may use"""
+    re2 = _load_re2()
+    options = re2.Options()
+    options.max_mem = 8 << 20
+    return re2.compile(pattern, options)
+
+def _combine_patterns(patterns: List[Tuple[str, re.Pattern]],
+                      compile_pattern: Callable[[str], Any] = re.compile) -> Tuple[Optional[Any], Dict[str, str]]:
+    """
+    Merge groupless patterns into one alternation of named groups
+    
+    Args:
+        patterns: (category, compiled pattern) pairs, in priority order
+        compile_pattern: Compiler for the combined source (re.compile by default)
+        
+    Returns:
+        Combined pattern (None if there is nothing to combine) and the
+        category of each group name
+    """
+    alternatives = []
+    group_categories = {}
+    
+    for index, (category, pattern) in enumerate(patterns):
+        name = f'{category}_{index}'
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            # Scope case folding to this alternative; a global flag would break the Person patterns
+            if source.startswith('(?i)'):
+                source = source[4:]
+            source = f'(?i:{source})'
+        alternatives.append(f'(?P<{name}>{source})')
+        group_categories[name] = category
+    
+    if not alternatives:
+        return None, {}
+    
+    return compile_pattern('|'.join(alternatives)), group_categories
+
 class DemoAzureAIRedactor:
     """Demo Azure AI redactor using regex patterns"""
     
@@ -41,27 +171,27 @@ class DemoAzureAIRedactor:
             'Person': [
                 re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'),  # First Last
                 re.compile(r'\b[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+\b'),  # First M. Last
-                re.compile(r'(?i)(?:name|employee|person|contact)\s*:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
-                re.compile(r'(?i)(?:from|to|by|signed)\s*:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
+                re.compile(r'(?i)(?:name|employee|person|contact)\s*+:?\s*+([A-Z][a-z]++\s++[A-Z][a-z]+)'),
+                re.compile(r'(?i)(?:from|to|by|signed)\s*+:?\s*+([A-Z][a-z]++\s++[A-Z][a-z]+)'),
             ],
             'PhoneNumber': [
-                re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),
+                re.compile(r'\b(?:\+?1[-.\s]?)?\(?(?:[0-9]{3})\)?[-.\s]?(?:[0-9]{3})[-.\s]?(?:[0-9]{4})\b'),
                 re.compile(r'\(\d{3}\)\s?\d{3}-?\d{4}'),  # (555) 123-4567 format
-                re.compile(r'(?i)(?:phone|tel|mobile|cell)\s*:?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE),
-                re.compile(r'(?i)(?:contact|call)\s*:?\s*(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE),
+                re.compile(r'(?i)(?:phone|tel|mobile|cell)\s*+:?\s*+(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'),
+                re.compile(r'(?i)(?:contact|call)\s*+:?\s*+(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'),
             ],
             'Address': [
                 re.compile(r'\b\d{1,5}\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Ct|Court|Circle|Cir|Place|Pl)\b', re.IGNORECASE),
-                re.compile(r'(?i)(?:address|addr)\s*:?\s*(\d{1,5}\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd))', re.IGNORECASE),
+                re.compile(r'(?i)(?:address|addr)\s*+:?\s*+(\d{1,5}+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd))'),
             ],
             'CreditCardNumber': [
                 re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),
-                re.compile(r'\b\d{13,19}\b'),  # Generic card number
-                re.compile(r'(?i)(?:card|cc|credit)\s*:?\s*(\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})', re.IGNORECASE),
+                re.compile(r'\b\d{13,19}\b'),  # Generic card number (Luhn-checked below)
+                re.compile(r'(?i)(?:card|cc|credit)\s*+:?\s*+(\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})'),
             ],
             'Email': [
-                re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-                re.compile(r'(?i)(?:email|e-mail)\s*:?\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', re.IGNORECASE),
+                re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'),
+                re.compile(r'(?i)(?:email|e-mail)\s*+:?\s*+([A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Za-z]{2,})'),
             ],
             'IPAddress': [
                 re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'),
@@ -72,61 +202,174 @@ class DemoAzureAIRedactor:
             'USPersonalIdentificationNumber': [
                 re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),  # Standard SSN
                 re.compile(r'\b\d{3}\s\d{2}\s\d{4}\b'),  # Space separated
-                re.compile(r'(?i)(?:ssn|social\s*security)\s*:?\s*(\d{3}[-\s]?\d{2}[-\s]?\d{4})', re.IGNORECASE),
+                re.compile(r'(?i)(?:ssn|social\s*security)\s*+:?\s*+(\d{3}[-\s]?\d{2}[-\s]?\d{4})'),
             ]
         }
         
-        logger.info("Demo Azure AI Redactor initialized with regex patterns")
-    
-    def detect_pii_entities(self, text: str) -> List[DemoPIIEntity]:
-        """Detect PII entities using enhanced regex patterns with context awareness"""
-        entities = []
+        # Token for every category the detector can emit, built once
+        self._tokens: Dict[str, str] = {
+            category: f'[{category.upper()}_REDACTED]' for category in self.patterns
+        } | dict(_DEFAULT_REDACTION_MAP)
         
+        # Contextual patterns keep their own scans: in one alternation a bare
+        # match starting earlier would consume the keyword and hide them.
+        # The bare patterns share a single alternation; when Hyperscan (or,
+        # failing that, RE2) is installed it finds where their first match
+        # starts, and texts without one skip the alternation.
+        self._contextual_patterns: List[Tuple[str, re.Pattern]] = []
+        plain_patterns: List[Tuple[str, re.Pattern]] = []
         for category, pattern_list in self.patterns.items():
             for pattern in pattern_list:
-                matches = pattern.finditer(text)
-                for match in matches:
-                    # For contextual patterns, extract the actual PII from the capture group
-                    if match.groups():
-                        # Use the captured group (the actual PII data)
-                        pii_text = match.group(1)
-                        # Find the position of the PII text within the full match
-                        full_match = match.group(0)
-                        pii_start = full_match.find(pii_text)
-                        offset = match.start() + pii_start
-                        length = len(pii_text)
-                    else:
-                        # Use the full match
-                        pii_text = match.group(0)
-                        offset = match.start()
-                        length = len(pii_text)
-                    
-                    entity = DemoPIIEntity(
-                        text=pii_text,
-                        category=category,
-                        subcategory=None,
-                        confidence_score=0.95 if match.groups() else 0.9,  # Higher confidence for contextual matches
-                        offset=offset,
-                        length=length
-                    )
-                    entities.append(entity)
-        
-        # Remove duplicates (same text at overlapping positions)
-        unique_entities = []
-        seen_positions = set()
-        
-        for entity in sorted(entities, key=lambda x: (x.offset, -x.confidence_score)):
-            # Check for overlap with existing entities
-            entity_range = range(entity.offset, entity.offset + entity.length)
-            overlap = any(
-                pos in entity_range 
-                for existing_start, existing_end in seen_positions
-                for pos in range(existing_start, existing_end)
+                if pattern.groups:
+                    self._contextual_patterns.append((category, pattern))
+                else:
+                    plain_patterns.append((category, pattern))
+        
+        self._hs_db = None
+        # Hyperscan scratch space is single-user; each thread gets its own clone
+        self._hs_local = threading.local()
+        
+        self._re2_combined = None
+        
+        if _load_hyperscan() is not None:
+            self._compile_hyperscan(plain_patterns)
+        elif _load_re2() is not None:
+            self._re2_combined, _ = _combine_patterns(plain_patterns, _compile_re2)
+        
+        # One alternation walks the text once instead of once per bare pattern
+        self._combined, self._group_categories = _combine_patterns(plain_patterns)
+        
+        logger.info("Demo Azure AI Redactor initialized with regex patterns",
+                   hyperscan=self._hs_db is not None,
+                   re2=self._re2_combined is not None)
+    
+    def _compile_hyperscan(self, plain_patterns: List[Tuple[str, re.Pattern]]) -> None:
+        """Compile the groupless patterns into one Hyperscan block-mode database"""
+        hyperscan = _load_hyperscan()
+        expressions = []
+        flags = []
+        
+        for category, pattern in plain_patterns:
+            pattern_flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+            if pattern.flags & re.IGNORECASE:
+                pattern_flags |= hyperscan.HS_FLAG_CASELESS
+            
+            expressions.append(pattern.pattern.encode('ascii'))
+            flags.append(pattern_flags)
+        
+        cache_path = _hs_cache_path(expressions, flags)
+        db = _load_hyperscan_cache(cache_path)
+        if db is None:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags
             )
+            _store_hyperscan_cache(cache_path, db)
+        
+        self._hs_db = db
+    
+    def _first_plain_match(self, text: str) -> Optional[int]:
+        """
+        Find where the leftmost bare-pattern match starts, using Hyperscan or RE2 when installed
+        
+        Args:
+            text: Text to analyze
             
-            if not overlap:
-                unique_entities.append(entity)
-                seen_positions.add((entity.offset, entity.offset + entity.length))
+        Returns:
+            Offset to start the re alternation from (0 without a fast engine),
+            or None if no bare pattern matches
+        """
+        # The engines' \b, \w and \s are ASCII and leave out \v and \x1c-\x1f,
+        # so only the re alternation itself can rule out other text
+        if (self._hs_db is None and self._re2_combined is None) or _FAST_SCAN_UNSAFE.search(text):
+            return 0
+        
+        if self._re2_combined is not None:
+            match = self._re2_combined.search(text)
+            return match.start() if match else None
+        
+        # Each reported start is the leftmost start of a real match, so the
+        # smallest one is where re's leftmost match begins too
+        first = None
+        
+        def on_match(pattern_id, start, end, flags, context):
+            nonlocal first
+            if first is None or start < first:
+                first = start
+        
+        # The text is ASCII here, so byte offsets equal character offsets
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = self._hs_db.scratch.clone()
+        
+        self._hs_db.scan(text.encode('ascii'), match_event_handler=on_match, scratch=scratch)
+        return first
+    
+    def has_pii_candidates(self, text: str) -> bool:
+        """Check whether any pattern matches the text, without building entities"""
+        if self._combined is not None:
+            first = self._first_plain_match(text)
+            if first is not None and self._combined.search(text, first):
+                return True
+        return any(pattern.search(text) for _, pattern in self._contextual_patterns)
+    
+    def detect_pii_entities(self, text: str) -> List[DemoPIIEntity]:
+        """Detect PII entities using enhanced regex patterns with context awareness"""
+        # Candidates are kept as parallel columns; entity objects are only
+        # built for the ones that survive filtering and deduplication
+        offsets: List[int] = []
+        lengths: List[int] = []
+        categories: List[str] = []
+        confidences: List[float] = []
+        
+        first = self._first_plain_match(text) if self._combined is not None else None
+        if first is not None:
+            for match in self._combined.finditer(text, first):
+                offsets.append(match.start())
+                lengths.append(match.end() - match.start())
+                confidences.append(0.9)
+                categories.append(self._group_categories[match.lastgroup])
+        
+        # For contextual patterns, the actual PII is the capture group
+        for category, pattern in self._contextual_patterns:
+            for match in pattern.finditer(text):
+                start, end = match.span(1)
+                offsets.append(start)
+                lengths.append(end - start)
+                confidences.append(0.95)  # Higher confidence for contextual matches
+                categories.append(category)
+        
+        # Bare digit runs are only card numbers if they pass the Luhn checksum;
+        # separated groups and "card:" context are strong enough signals on their own
+        order = []
+        for i, category in enumerate(categories):
+            if category == 'CreditCardNumber':
+                digits = text[offsets[i]:offsets[i] + lengths[i]]
+                # Non-ASCII digit runs (Unicode \d) are kept as they are
+                if digits.isascii() and digits.isdigit() and not luhn_valid(digits):
+                    continue
+            order.append(i)
+        
+        # Remove duplicates (same text at overlapping positions); earlier
+        # matches win, then contextual ones, then pattern order
+        order.sort(key=lambda i: (offsets[i], -confidences[i]))
+        keep = resolve_overlaps([offsets[i] for i in order], [lengths[i] for i in order])
+        order = [i for i, kept in zip(order, keep) if kept]
+        
+        unique_entities = [
+            DemoPIIEntity(
+                text=text[offsets[i]:offsets[i] + lengths[i]],
+                category=categories[i],
+                subcategory=None,
+                confidence_score=confidences[i],
+                offset=offsets[i],
+                length=lengths[i]
+            )
+            for i in order
+        ]
         
         logger.info("Enhanced demo PII detection completed", entities_found=len(unique_entities))
         return unique_entities
@@ -135,36 +378,33 @@ class DemoAzureAIRedactor:
         """Redact PII entities from text"""
         entities = self.detect_pii_entities(text)
         
-        # Default redaction patterns
-        default_redaction_map = {
-            'Person': '[NAME_REDACTED]',
-            'PersonType': '[TITLE_REDACTED]',
-            'PhoneNumber': '[PHONE_REDACTED]',
-            'Address': '[ADDRESS_REDACTED]',
-            'CreditCardNumber': '[CREDIT_CARD_REDACTED]',
-            'Email': '[EMAIL_REDACTED]',
-            'IPAddress': '[IP_ADDRESS_REDACTED]',
-        }
-        
         # Merge custom redaction map if provided
-        redaction_map = default_redaction_map.copy()
+        redaction_map = self._tokens
         if custom_redaction_map:
-            redaction_map.update(custom_redaction_map)
-        
-        # Sort entities by offset in reverse order
-        sorted_entities = sorted(entities, key=lambda x: x.offset, reverse=True)
+            redaction_map = self._tokens | custom_redaction_map
         
-        redacted_text = text
+        # Single forward pass: collect untouched slices and tokens, join once
+        parts = []
+        cursor = 0
         redaction_count = 0
         confidence_scores = {}
         
-        for entity in sorted_entities:
-            redaction_token = redaction_map.get(entity.category, f'[{entity.category.upper()}_REDACTED]')
+        sorted_entities = sorted(entities, key=lambda x: (x.offset, -x.length))
+        keep = resolve_overlaps([entity.offset for entity in sorted_entities],
+                                [entity.length for entity in sorted_entities])
+        
+        for entity, kept in zip(sorted_entities, keep):
+            # Skip anything overlapping an entity that was already redacted
+            if not kept or entity.offset < cursor:
+                continue
             
-            # Replace the entity in the text
-            start = entity.offset
-            end = entity.offset + entity.length
-            redacted_text = redacted_text[:start] + redaction_token + redacted_text[end:]
+            try:
+                redaction_token = redaction_map[entity.category]
+            except KeyError:
+                redaction_token = f'[{entity.category.upper()}_REDACTED]'
+            parts.append(text[cursor:entity.offset])
+            parts.append(redaction_token)
+            cursor = entity.offset + entity.length
             
             redaction_count += 1
             
@@ -173,6 +413,9 @@ class DemoAzureAIRedactor:
                 confidence_scores[entity.category] = []
             confidence_scores[entity.category].append(entity.confidence_score)
         
+        parts.append(text[cursor:])
+        redacted_text = ''.join(parts)
+        
         # Calculate average confidence scores per category
         avg_confidence_scores = {
             category: sum(scores) / len(scores)
@@ -193,35 +436,23 @@ class DemoAzureAIRedactor:
         
         return result
     
-    def analyze_document_risk(self, text: str) -> Dict[str, Any]:
-        """Analyze document for PII risk assessment"""
-        entities = self.detect_pii_entities(text)
+    def analyze_document_risk(self, text: str, entities: Optional[List[DemoPIIEntity]] = None) -> Dict[str, Any]:
+        """Analyze document for PII risk assessment, reusing already detected entities if given"""
+        if entities is None:
+            entities = self.detect_pii_entities(text)
         
         # Count entities by category
-        category_counts = {}
+        category_counts = dict(Counter(entity.category for entity in entities))
         high_risk_entities = []
         
         for entity in entities:
-            category = entity.category
-            if category not in category_counts:
-                category_counts[category] = 0
-            category_counts[category] += 1
-            
             # High-risk entities (sensitive categories)
-            if entity.category in ['CreditCardNumber', 'PhoneNumber', 'Address']:
+            if entity.category in _HIGH_RISK_CATEGORIES:
                 high_risk_entities.append(entity)
         
         # Calculate risk score
-        risk_multipliers = {
-            'CreditCardNumber': 5,
-            'PhoneNumber': 3,
-            'Address': 4,
-            'Person': 2,
-            'Email': 2
-        }
-        
         risk_score = sum(
-            count * risk_multipliers.get(category, 1)
+            count * _RISK_MULTIPLIERS.get(category, 1)
             for category, count in category_counts.items()
         )
         
@@ -261,3 +492,13 @@ class DemoAzureAIRedactor:
         recommendations.append("🔧 Demo Mode: Using regex patterns - Azure AI would provide higher accuracy")
         
         return recommendations
+
+@lru_cache(maxsize=None)
+def get_demo_redactor() -> DemoAzureAIRedactor:
+    """
+    Return the process-wide demo redactor
+    
+    Returns:
+        Cached DemoAzureAIRedactor, so its patterns are compiled only once
+    """
+    return DemoAzureAIRedactor()
@@ -0,0 +1,72 @@
+"""
+Logging Compatibility Layer
+Uses structlog when installed and falls back to the standard logging module
+"""
+
+import logging
+
+try:
+    import structlog
+except ImportError:
+    structlog = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class _KeywordLogger:
+    """Standard logging wrapper accepting structlog-style keyword context"""
+    
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+    
+    def _log(self, level: int, event: str, **context) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        
+        if context:
+            details = ' '.join(f'{key}={value!r}' for key, value in context.items())
+            event = f'{event} {details}'
+        self._logger.log(level, event)
+    
+    def debug(self, event: str, **context) -> None:
+        self._log(logging.DEBUG, event, **context)
+    
+    def info(self, event: str, **context) -> None:
+        self._log(logging.INFO, event, **context)
+    
+    def warning(self, event: str, **context) -> None:
+        self._log(logging.WARNING, event, **context)
+    
+    def error(self, event: str, **context) -> None:
+        self._log(logging.ERROR, event, **context)
+
+def get_logger(name: str):
+    """
+    Return a keyword-friendly logger
+    
+    Args:
+        name: Logger name (usually __name__)
+    
+    Returns:
+        structlog logger, or a standard logging wrapper if structlog is missing
+    """
+    if structlog is not None:
+        return structlog.get_logger(name)
+    return _KeywordLogger(name)
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize a log event with orjson (non-JSON values fall back to str)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def json_renderer():
+    """
+    Return a structlog JSON renderer
+    
+    Returns:
+        JSONRenderer backed by orjson when installed, the standard json module otherwise
+    """
+    if orjson is not None:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer()
@@ -7,12 +7,15 @@ import os
 import sys
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Iterator
+from dataclasses import replace
 import json
 
 # Configure logging first
 import structlog
 
+from logging_compat import json_renderer
+
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -20,7 +23,8 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
+        # JSON lines for log shippers; batch results carry every entity, so use the fast encoder
+        json_renderer() if os.getenv('REDACTION_LOG_FORMAT', '').lower() == 'json' else structlog.dev.ConsoleRenderer()
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -31,7 +35,7 @@ logger = structlog.get_logger(__name__)
 
 # Import our Azure AI modules
 try:
-    from azure_config import AzureConfig
+    from azure_config import get_config
     from azure_document_processor import AzureDocumentProcessor
     from azure_ai_redactor import AzureAIRedactor
 except ImportError as e:
@@ -40,6 +44,29 @@ except ImportError as e:
     print("Run: pip install -r requirements.txt")
     sys.exit(1)
 
+def _document_sections(file_path: Path) -> Iterator[str]:
+    """
+    Yield a document's text one section at a time
+    
+    PDFs are read page by page so only one page's text is held at once; a
+    DOCX is already fully parsed in memory and is yielded whole.
+    
+    Args:
+        file_path: Path to a .docx or .pdf document
+        
+    Returns:
+        Iterator over section texts (joined with newlines they form the document text)
+    """
+    if file_path.suffix.lower() == '.docx':
+        from docx import Document
+        doc = Document(str(file_path))
+        yield "\n".join([para.text for para in doc.paragraphs])
+    else:
+        import PyPDF2
+        with open(file_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages:
+                yield page.extract_text() or ""
+
 class AzureRedactionCLI:
     """Command-line interface for Azure AI document redaction"""
     
@@ -59,7 +86,7 @@ class AzureRedactionCLI:
             True if setup successful, False otherwise
         """
         try:
-            self.config = AzureConfig(env_file)
+            self.config = get_config(env_file)
             
             if not self.config.validate_configuration():
                 logger.error("Invalid Azure configuration")
@@ -148,29 +175,28 @@ class AzureRedactionCLI:
         print(f"🔍 Analyzing document: {input_path}")
         
         try:
-            # Extract text based on file type
             file_path = Path(input_path)
-            
-            if file_path.suffix.lower() == '.docx':
-                from docx import Document
-                doc = Document(input_path)
-                text = "\n".join([para.text for para in doc.paragraphs])
-            elif file_path.suffix.lower() == '.pdf':
-                import PyPDF2
-                with open(input_path, 'rb') as file:
-                    reader = PyPDF2.PdfReader(file)
-                    text = "\n".join([page.extract_text() for page in reader.pages])
-            else:
+            if file_path.suffix.lower() not in ('.docx', '.pdf'):
                 print("❌ Unsupported file type")
                 return
             
-            # Analyze with Azure AI
+            # Analyze with Azure AI, one section at a time; entity offsets are
+            # shifted so they refer to the newline-joined document text
             redactor = AzureAIRedactor(self.config)
-            entities = redactor.detect_pii_entities(text)
-            risk_analysis = redactor.analyze_document_risk(text)
+            entities = []
+            total_chars = 0
+            for index, section in enumerate(_document_sections(file_path)):
+                if index:
+                    total_chars += 1
+                entities.extend(
+                    replace(entity, offset=entity.offset + total_chars)
+                    for entity in redactor.detect_pii_entities(section)
+                )
+                total_chars += len(section)
+            risk_analysis = redactor.analyze_document_risk('', entities=entities)
             
             print(f"📊 Analysis Results:")
-            print(f"   • Total characters: {len(text)}")
+            print(f"   • Total characters: {total_chars}")
             print(f"   • PII entities found: {len(entities)}")
             print(f"   • Risk score: {risk_analysis['risk_score']}")
             print(f"   • Risk level: {risk_analysis['risk_level']}")
@@ -0,0 +1,56 @@
+"""
+Numba kernels behind pii_hot
+Requires NumPy and Numba; pii_hot imports this module on first use
+"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def merge_intervals_kernel(starts, ends):
+    n = starts.shape[0]
+    keep = np.zeros(n, np.bool_)
+    kept_starts = np.empty(n, np.int64)
+    kept_ends = np.empty(n, np.int64)
+    count = 0
+    
+    for i in range(n):
+        start = starts[i]
+        end = ends[i]
+        if start >= end:
+            keep[i] = True
+            continue
+        
+        idx = np.searchsorted(kept_starts[:count], start, side='right')
+        if idx > 0 and kept_ends[idx - 1] > start:
+            continue
+        if idx < count and kept_starts[idx] < end:
+            continue
+        
+        for j in range(count, idx, -1):
+            kept_starts[j] = kept_starts[j - 1]
+            kept_ends[j] = kept_ends[j - 1]
+        kept_starts[idx] = start
+        kept_ends[idx] = end
+        count += 1
+        keep[i] = True
+    
+    return keep
+
+@njit(cache=True)
+def resolve_overlaps_kernel(offsets, lengths):
+    n = offsets.shape[0]
+    keep = np.zeros(n, np.bool_)
+    # Stable sort so equal offsets keep their caller-given priority
+    order = np.argsort(offsets, kind='mergesort')
+    cursor = -1
+    
+    for k in range(n):
+        i = order[k]
+        if lengths[i] == 0:
+            keep[i] = True
+        elif offsets[i] >= cursor:
+            keep[i] = True
+            cursor = offsets[i] + lengths[i]
+    
+    return keep
@@ -26,8 +26,8 @@ def run_command(command, description):
 def check_python_version():
     """Check if Python version is compatible"""
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("❌ Python 3.8 or higher is required")
+    if version.major < 3 or (version.major == 3 and version.minor < 11):
+        print("❌ Python 3.11 or higher is required")
         print(f"Current version: {version.major}.{version.minor}.{version.micro}")
         return False
     
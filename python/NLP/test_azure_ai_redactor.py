@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for the Azure AI redactor's local (regex and overlap resolution) paths
+"""
+
+import asyncio
+import random
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the current directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+import pytest
+
+from azure_ai_redactor import AzureAIRedactor, PIIEntity, redaction_token
+from azure_config import AzureConfig
+
+class OfflineConfig:
+    """Configuration that passes validation but never reaches Azure"""
+    confidence_threshold = 0.8
+    pii_categories = ['Person', 'PhoneNumber', 'Address', 'CreditCardNumber', 'Email']
+    regex_engine = 're'
+    azure_prefilter = False
+    
+    def validate_configuration(self):
+        return True
+    
+    def get_text_analytics_client(self):
+        return None
+
+class FakeTextAnalyticsClient:
+    """Stands in for Azure, reporting capitalised word pairs as people"""
+    
+    def recognize_pii_entities(self, documents, language, categories_filter):
+        return [
+            SimpleNamespace(is_error=False, entities=[
+                SimpleNamespace(text=match.group(), category='Person', subcategory=None,
+                                confidence_score=0.9, offset=match.start(), length=len(match.group()))
+                for match in re.finditer(r'[A-Z][a-z]+ [A-Z][a-z]+', document)
+            ])
+            for document in documents
+        ]
+
+class FakeAzureConfig(OfflineConfig):
+    """Configuration whose client is FakeTextAnalyticsClient"""
+    
+    def get_text_analytics_client(self):
+        return FakeTextAnalyticsClient()
+
+@pytest.fixture
+def redactor():
+    return AzureAIRedactor(OfflineConfig())
+
+def _entity(text, offset, length, confidence):
+    return PIIEntity(
+        text=text[offset:offset + length],
+        category='Person',
+        subcategory=None,
+        confidence_score=confidence,
+        offset=offset,
+        length=length
+    )
+
+def test_chained_overlaps_keep_earlier_entity(redactor, monkeypatch):
+    """A loses to B and B to C; A no longer overlaps anything kept and must stay redacted"""
+    text = 'Alice Walker met Carl Young'
+    azure = [_entity(text, 0, 12, 0.90), _entity(text, 6, 10, 0.95), _entity(text, 13, 9, 0.99)]
+    monkeypatch.setattr(redactor, '_azure_candidates', lambda _: iter(azure))
+    
+    result = redactor.redact_text(text)
+    
+    assert [(e.offset, e.length) for e in result.entities_found] == [(0, 12), (13, 9)]
+    assert result.redacted_text == '[NAME_REDACTED] [NAME_REDACTED]Young'
+    assert 'Alice' not in result.redacted_text
+
+def test_redaction_agrees_with_detection(redactor, monkeypatch):
+    """redact_text removes exactly the entities detect_pii_entities reports"""
+    text = 'Call Alice Walker at (555) 123-4567 or alice@example.com, SSN 123-45-6789'
+    azure = [_entity(text, 5, 12, 0.85), _entity(text, 11, 13, 0.99), _entity(text, 0, 4, 0.81)]
+    monkeypatch.setattr(redactor, '_azure_candidates', lambda _: iter(azure))
+    
+    detected = sorted(redactor.detect_pii_entities(text), key=lambda e: e.offset)
+    result = redactor.redact_text(text)
+    
+    assert list(result.entities_found) == detected
+    
+    # Baseline: replace the detected entities one at a time, right to left
+    expected = text
+    for entity in sorted(detected, key=lambda e: e.offset, reverse=True):
+        end = entity.offset + entity.length
+        expected = expected[:entity.offset] + redaction_token(entity.category) + expected[end:]
+    assert result.redacted_text == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ('4111111111111111-45-6789', '[CREDIT_CARD_REDACTED]-45-6789'),
+    ('card 4111 1111 1111 1111 ok', 'card [CREDIT_CARD_REDACTED] ok'),
+    ('ref 4111-1111-1111-1111 ok', 'ref [CREDIT_CARD_REDACTED] ok'),
+    ('amex 3782 822463 10005 ok', 'amex [CREDIT_CARD_REDACTED] ok'),
+    ('order 1234567812345678 x', 'order 1234567812345678 x'),
+])
+def test_card_numbers_are_luhn_checked(redactor, monkeypatch, text, expected):
+    """Card-shaped numbers are redacted only when they pass the Luhn checksum"""
+    monkeypatch.setattr(redactor, '_azure_candidates', lambda _: iter(()))
+    
+    assert redactor.redact_text(text).redacted_text == expected
+
+@pytest.mark.parametrize('text', [
+    'Invoices 1001 1002 1003 1004 1005 paid',
+    'Parts 100-200-300-400-500',
+    'Table 10 20 30 40 50 60 70 80 90',
+    'Years 1996 1997 1998 1999 2000 2001 2002',
+    'Scores 88 91 79 85 90 77 93 84 86 95',
+    'Run 4111111111111111123 rejected',
+])
+def test_number_lists_are_not_card_numbers(redactor, monkeypatch, text):
+    """Lists and longer runs of digits are never sliced into card-number windows"""
+    monkeypatch.setattr(redactor, '_azure_candidates', lambda _: iter(()))
+    
+    assert redactor.redact_text(text).redacted_text == text
+
+def test_redact_batch_matches_redact_text():
+    """Batched Azure calls give the same result as redacting each text on its own"""
+    redactor = AzureAIRedactor(FakeAzureConfig())
+    texts = [
+        'Alice Walker called (555) 123-4567',
+        '',
+        'No PII here',
+        'Card 4111 1111 1111 1111 for Carl Young, alice@example.com',
+        # Longer than one Azure chunk, with a name straddling the chunk boundary
+        'x' * 4995 + ' Mary Jones and Tom Brown ' + 'y' * 5000 + ' SSN 123-45-6789',
+    ] * 3
+    
+    batch = redactor.redact_batch(texts, max_workers=3)
+    
+    assert len(batch) == len(texts)
+    for text, result in zip(texts, batch):
+        expected = redactor.redact_text(text)
+        assert result.redacted_text == expected.redacted_text
+        assert result.entities_found == expected.entities_found
+        assert result.redaction_count == expected.redaction_count
+
+def test_azure_prefilter_is_opt_in(monkeypatch):
+    """Skipping Azure loses entities only Azure finds, so it stays off unless asked for"""
+    monkeypatch.delenv('REDACTION_AZURE_PREFILTER', raising=False)
+    assert AzureConfig().azure_prefilter is False
+    
+    monkeypatch.setenv('REDACTION_AZURE_PREFILTER', 'true')
+    assert AzureConfig().azure_prefilter is True
+
+def test_long_text_chunks_are_sent_in_batches(monkeypatch):
+    """A long text's chunks go five per request, with the same entities as one call per chunk"""
+    redactor = AzureAIRedactor(FakeAzureConfig())
+    requests = []
+    recognize = redactor.client.recognize_pii_entities
+    
+    def counting_recognize(documents, language, categories_filter):
+        requests.append(len(documents))
+        return recognize(documents, language, categories_filter)
+    
+    monkeypatch.setattr(redactor.client, 'recognize_pii_entities', counting_recognize)
+    text = ' '.join(f'Item {i} for Alice Walker' for i in range(2000))
+    
+    entities = list(redactor._azure_candidates(text))
+    
+    chunk_count = -(-len(text) // 5000)
+    assert sorted(requests, reverse=True) == [5] * (chunk_count // 5) + [chunk_count % 5] * (chunk_count % 5 > 0)
+    expected = []
+    for offset in range(0, len(text), 5000):
+        expected.extend(redactor._entities_from_result(recognize([text[offset:offset + 5000]], 'en', None)[0], offset))
+    assert entities == expected
+
+def test_redact_text_async_matches_redact_text():
+    redactor = AzureAIRedactor(FakeAzureConfig())
+    text = 'Alice Walker called (555) 123-4567 about Carl Young'
+    assert asyncio.run(redactor.redact_text_async(text)) == redactor.redact_text(text)
+
+NON_ASCII_TOKENS = [
+    'Contact', 'contact', 'Name:', 'from', 'José', 'Núñez', 'John', 'Smith', 'ſmith', 'Kelvin',
+    'Straße', '123', '١٢٣', '456', 'Main', 'Street', 'Ave', 'Phone:', '555-123-4567', '(555) 123-4567',
+    '123-45-6789', 'SSN:', 'ssn', 'a@b.com', 'é@x.com', 'Email:', 'card', '4111111111111111',
+    ' ', ' ', '\xa0', ' ', '\x0b', '\x1c', '\n', ':', 'é', 'x',
+]
+
+class Re2Config(OfflineConfig):
+    regex_engine = 're2'
+
+def test_re2_engine_matches_re_on_non_ascii_text(redactor):
+    pytest.importorskip('re2')
+    re2_redactor = AzureAIRedactor(Re2Config())
+    rng = random.Random(9)
+    for _ in range(3000):
+        separator = rng.choice(['', ' ', ' '])
+        text = separator.join(rng.choice(NON_ASCII_TOKENS) for _ in range(rng.randint(1, 10)))
+        assert re2_redactor._fallback_detection(text) == redactor._fallback_detection(text), repr(text)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the DOCX run redaction of the Azure document processor
+"""
+
+import sys
+from pathlib import Path
+
+# Add the current directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+import pytest
+
+docx = pytest.importorskip('docx')
+
+from azure_ai_redactor import PIIEntity, redaction_token
+from azure_document_processor import AzureDocumentProcessor, _collect_runs, _redact_runs
+from test_azure_ai_redactor import OfflineConfig
+
+def _document(paragraphs):
+    """Build a document whose paragraphs are made of the given run texts"""
+    document = docx.Document()
+    for run_texts in paragraphs:
+        paragraph = document.add_paragraph()
+        for run_text in run_texts:
+            paragraph.add_run(run_text)
+    return document
+
+def _entity(text, fragment, category):
+    offset = text.index(fragment)
+    return PIIEntity(
+        text=fragment,
+        category=category,
+        subcategory=None,
+        confidence_score=0.9,
+        offset=offset,
+        length=len(fragment)
+    )
+
+def test_redact_runs_matches_text_replacement():
+    """Editing runs in place gives the same text as replacing entities in the flattened text"""
+    document = _document([
+        ['Contact ', 'Alice', ' Walker', ' today'],
+        ['Mail alice@example.com or call (555) ', '123-', '4567', '.'],
+        ['Nothing to see'],
+        ['SSN: 123-45-6789'],
+    ])
+    paragraphs = document.paragraphs
+    text, run_starts, runs = _collect_runs(paragraphs)
+    entities = [
+        _entity(text, 'Alice Walker', 'Person'),
+        _entity(text, 'alice@example.com', 'Email'),
+        _entity(text, '(555) 123-4567', 'PhoneNumber'),
+        _entity(text, '123-45-6789', 'USPersonalIdentificationNumber'),
+    ]
+    
+    modified = _redact_runs(run_starts, runs, entities)
+    
+    # Baseline: replace the entities in the flattened text, right to left
+    expected = text
+    for entity in sorted(entities, key=lambda e: e.offset, reverse=True):
+        end = entity.offset + entity.length
+        expected = expected[:entity.offset] + redaction_token(entity.category) + expected[end:]
+    
+    assert ''.join(paragraph.text + '\n' for paragraph in paragraphs) == expected
+    assert modified == 6
+    
+    # The token sits in the entity's first run, which is highlighted; later runs are only trimmed
+    first_paragraph = paragraphs[0].runs
+    assert [run.text for run in first_paragraph] == ['Contact ', '[NAME_REDACTED]', '', ' today']
+    assert first_paragraph[1].font.highlight_color is not None
+    assert first_paragraph[2].font.highlight_color is None
+
+def test_batch_process_finds_upper_case_extensions_in_name_order(tmp_path, monkeypatch):
+    for name in ['memo.DOCX', 'REPORT.PDF', 'a.pdf', 'notes.txt', 'b.docx']:
+        (tmp_path / name).write_bytes(b'')
+    
+    processor = AzureDocumentProcessor(OfflineConfig())
+    seen = []
+    monkeypatch.setattr(processor, 'process_group', lambda pairs: seen.extend(pairs) or
+                        [{'status': 'success'} for _ in pairs])
+    
+    result = processor.batch_process(str(tmp_path), str(tmp_path / 'out'))
+    
+    assert [Path(input_path).name for input_path, _ in seen] == ['REPORT.PDF', 'a.pdf', 'b.docx', 'memo.DOCX']
+    assert result['documents_processed'] == 4
@@ -8,7 +8,8 @@ import os
 from pathlib import Path
 import structlog
 
-# Setup logging
+# Route the redactors' structlog output through stdlib logging, which keeps
+# their info-level events out of the demo's printed output
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -23,8 +24,6 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger(__name__)
-
 def test_azure_imports():
     """Test if Azure AI modules can be imported"""
     print("🧪 Testing Azure AI imports...")
@@ -88,7 +87,7 @@ def test_demo_redactor():
     
     # Risk analysis
     print("\n📊 Risk Analysis...")
-    risk = redactor.analyze_document_risk(sample_text)
+    risk = redactor.analyze_document_risk(sample_text, entities=result.entities_found)
     
     print(f"Risk Score: {risk['risk_score']}")
     print(f"Risk Level: {risk['risk_level']}")
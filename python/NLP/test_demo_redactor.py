@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the demo redactor's combined and contextual pattern scans
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the current directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+import pytest
+
+import demo_redactor
+import pii_hot
+from demo_redactor import DemoAzureAIRedactor
+
+GLUED_TOKENS = [
+    'John Smith', 'Mary', 'Contact', 'contact', 'bob lee', 'Call', 'call', '(555) 123-4567',
+    '555-123-4567', '+1 555 123 4567', '123 Main Street', 'Address:', '456 Oak Ave', 'today.',
+    '4111111111111111', '4532 1234 5678 9012', '1234567812345678', 'card', 'CC:', 'a@b.com',
+    'Email:', '10.0.0.1', 'CEO', 'Vice President', '123-45-6789', '123 45 6789', 'SSN:', 'from',
+    'To', 'Ann M. Lee', 'x', '1', ' ', '\n', '\x0b', '\x1c', ':', '-', '(', ')', 'José Núñez', '١٢٣',
+]
+
+def glued_samples(count, seed):
+    """PII-like tokens run together, with and without spaces"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        separator = rng.choice(['', '', ' '])
+        yield separator.join(rng.choice(GLUED_TOKENS) for _ in range(rng.randint(1, 10)))
+
+def baseline_redact(redactor, text):
+    """The original detection: every pattern scanned on its own, earliest then contextual matches kept"""
+    candidates = []
+    for category, pattern_list in redactor.patterns.items():
+        for pattern in pattern_list:
+            for match in pattern.finditer(text):
+                group = 1 if pattern.groups else 0
+                candidates.append((match.start(group), match.end(group), 0.95 if pattern.groups else 0.9, category))
+    
+    parts = []
+    cursor = 0
+    for start, end, _, category in sorted(candidates, key=lambda c: (c[0], -c[2])):
+        digits = text[start:end]
+        if category == 'CreditCardNumber' and digits.isdigit() and not pii_hot._luhn_valid_py(digits):
+            continue
+        if start < cursor:
+            continue
+        parts.append(text[cursor:start])
+        parts.append(redactor._tokens[category])
+        cursor = end
+    parts.append(text[cursor:])
+    return ''.join(parts)
+
+@pytest.fixture
+def re_redactor(monkeypatch):
+    """Redactor limited to the re path, whatever engines are installed"""
+    redactor = DemoAzureAIRedactor()
+    monkeypatch.setattr(redactor, '_hs_db', None)
+    monkeypatch.setattr(redactor, '_re2_combined', None)
+    return redactor
+
+@pytest.mark.parametrize('text', [
+    'Mary Contact bob lee',
+    'Ring Jo Call (555) 123-4567',
+    'Sent by Ann Marie Contact bob lee',
+])
+def test_contextual_patterns_survive_earlier_bare_matches(re_redactor, text):
+    """A bare match that swallows the keyword must not hide the contextual match after it"""
+    assert re_redactor.redact_text(text).redacted_text == baseline_redact(re_redactor, text)
+
+def test_glued_contact_name_is_redacted(re_redactor):
+    assert re_redactor.redact_text('Mary Contact bob lee').redacted_text == '[NAME_REDACTED] [NAME_REDACTED]'
+
+def _engine_redactors():
+    """Redactors using each installed fast engine as their prefilter"""
+    redactors = []
+    if demo_redactor._load_hyperscan() is not None:
+        redactors.append(pytest.param(DemoAzureAIRedactor(), id='hyperscan'))
+    if demo_redactor._load_re2() is not None:
+        re2_redactor = DemoAzureAIRedactor()
+        re2_redactor._hs_db = None
+        re2_redactor._re2_combined, _ = demo_redactor._combine_patterns(
+            [(category, pattern) for category, patterns in re2_redactor.patterns.items()
+             for pattern in patterns if not pattern.groups],
+            demo_redactor._compile_re2
+        )
+        redactors.append(pytest.param(re2_redactor, id='re2'))
+    return redactors
+
+@pytest.mark.parametrize('fast_redactor', _engine_redactors())
+def test_fast_engines_match_re_path(fast_redactor, re_redactor):
+    """The Hyperscan and RE2 prefilters never change what is detected"""
+    texts = ['Call 555-123-4567 or visit 123 Main Street today.', '', 'nothing here', *glued_samples(3000, seed=5)]
+    for text in texts:
+        assert fast_redactor.detect_pii_entities(text) == re_redactor.detect_pii_entities(text), text
+
+@pytest.mark.parametrize('engine_redactor', [*_engine_redactors(), pytest.param(None, id='re')])
+def test_has_pii_candidates_agrees_with_detection(engine_redactor, re_redactor):
+    redactor = engine_redactor or re_redactor
+    assert not redactor.has_pii_candidates('12 apples, 3 pears')
+    for text in glued_samples(1000, seed=6):
+        if redactor.detect_pii_entities(text):
+            assert redactor.has_pii_candidates(text), text
+
+def test_importing_does_not_load_fast_engines():
+    """Hyperscan and RE2 are imported when the first redactor is built, not with the module"""
+    code = 'import sys, demo_redactor; print("hyperscan" in sys.modules or "re2" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == 'False'
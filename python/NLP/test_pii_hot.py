@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the pii_hot kernels: the Numba and pure Python paths must agree
+with each other and with a straightforward baseline
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Add the current directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+import pytest
+
+import pii_hot
+from pii_hot import luhn_valid, merge_intervals, resolve_overlaps
+
+def _random_intervals(rng, count):
+    starts = [rng.randint(0, 60) for _ in range(count)]
+    ends = [start + rng.randint(0, 8) for start in starts]
+    return starts, ends
+
+def _baseline_merge(starts, ends):
+    """Keep an interval unless it overlaps one kept before it"""
+    kept = []
+    keep = []
+    for start, end in zip(starts, ends):
+        if start < end and any(start < kept_end and kept_start < end for kept_start, kept_end in kept):
+            keep.append(False)
+            continue
+        if start < end:
+            kept.append((start, end))
+        keep.append(True)
+    return keep
+
+def _baseline_resolve(offsets, lengths):
+    """Walk intervals by offset, keeping each that starts after every kept one ends"""
+    keep = [False] * len(offsets)
+    kept_ends = []
+    for i in sorted(range(len(offsets)), key=lambda i: offsets[i]):
+        if lengths[i] == 0 or all(offsets[i] >= end for end in kept_ends):
+            keep[i] = True
+            if lengths[i]:
+                kept_ends.append(offsets[i] + lengths[i])
+    return keep
+
+def _baseline_luhn(digits):
+    total = 0
+    for position, digit in enumerate(int(char) for char in reversed(digits)):
+        if position % 2:
+            digit = sum(divmod(digit * 2, 10))
+        total += digit
+    return total % 10 == 0
+
+@pytest.mark.parametrize('seed', range(20))
+def test_merge_intervals_matches_baseline(seed):
+    rng = random.Random(seed)
+    starts, ends = _random_intervals(rng, rng.randint(0, 40))
+    
+    expected = _baseline_merge(starts, ends)
+    assert merge_intervals(starts, ends) == expected
+    assert pii_hot._merge_intervals_py(starts, ends) == expected
+
+@pytest.mark.parametrize('seed', range(20))
+def test_resolve_overlaps_matches_baseline(seed):
+    rng = random.Random(seed)
+    offsets, ends = _random_intervals(rng, rng.randint(0, 40))
+    lengths = [end - offset for offset, end in zip(offsets, ends)]
+    
+    expected = _baseline_resolve(offsets, lengths)
+    assert resolve_overlaps(offsets, lengths) == expected
+    assert pii_hot._resolve_overlaps_py(offsets, lengths) == expected
+
+@pytest.mark.parametrize('digits', [
+    '4111111111111111', '4532015112830366', '4532015112830367', '378282246310005',
+    '0', '00', '18', '4111111111111111123', '79927398713',
+])
+def test_luhn_valid_matches_baseline(digits):
+    assert luhn_valid(digits) == _baseline_luhn(digits)
+    assert pii_hot._luhn_valid_py(digits) == _baseline_luhn(digits)
+
+@pytest.mark.parametrize('count', [pii_hot._MERGE_KERNEL_MIN_SIZE, pii_hot._RESOLVE_KERNEL_MIN_SIZE, 2000])
+def test_large_inputs_match_baseline(count):
+    """Inputs large enough for the Numba kernels give the baseline result too"""
+    rng = random.Random(count)
+    starts = [rng.randint(0, count * 4) for _ in range(count)]
+    ends = [start + rng.randint(0, 8) for start in starts]
+    lengths = [end - start for start, end in zip(starts, ends)]
+    
+    assert merge_intervals(starts, ends) == _baseline_merge(starts, ends)
+    assert resolve_overlaps(starts, lengths) == _baseline_resolve(starts, lengths)
+
+@pytest.mark.skipif(pii_hot._load_kernels() is None, reason='Numba is not installed')
+def test_numba_kernels_match_pure_python():
+    kernels = pii_hot._load_kernels()
+    np = kernels.np
+    rng = random.Random(7)
+    for _ in range(200):
+        starts, ends = _random_intervals(rng, rng.randint(1, 40))
+        lengths = [end - start for start, end in zip(starts, ends)]
+        
+        merged = kernels.merge_intervals_kernel(np.asarray(starts, dtype=np.int64),
+                                                np.asarray(ends, dtype=np.int64))
+        assert merged.tolist() == pii_hot._merge_intervals_py(starts, ends)
+        
+        resolved = kernels.resolve_overlaps_kernel(np.asarray(starts, dtype=np.int64),
+                                                   np.asarray(lengths, dtype=np.int64))
+        assert resolved.tolist() == pii_hot._resolve_overlaps_py(starts, lengths)
+
+def test_importing_redactors_does_not_load_numba():
+    """Numba is only imported once an input is large enough to use it"""
+    code = 'import sys, azure_ai_redactor, demo_redactor; print("numba" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == 'False'
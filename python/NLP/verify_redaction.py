@@ -7,6 +7,25 @@ import sys
 from pathlib import Path
 import PyPDF2
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+def extract_pdf_text(file_path):
+    """Concatenate the text of every page, with PDFium when it is installed"""
+    if pdfium is None:
+        with open(file_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            return "".join(page.extract_text() for page in reader.pages)
+    
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        # PDFium terminates lines with CRLF; normalise to match PyPDF2
+        return "".join(page.get_textpage().get_text_range().replace('\r\n', '\n') for page in pdf)
+    finally:
+        pdf.close()
+
 def compare_pdfs():
     """Compare original and redacted PDF content"""
     
@@ -24,22 +43,14 @@ def compare_pdfs():
     # Extract original text
     print("📄 Original Document Content:")
     print("=" * 50)
-    with open(original_file, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        original_text = ""
-        for page in reader.pages:
-            original_text += page.extract_text()
+    original_text = extract_pdf_text(original_file)
     
     print(original_text)
     
     # Extract redacted text
     print("\n🔒 Redacted Document Content:")
     print("=" * 50)
-    with open(redacted_file, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        redacted_text = ""
-        for page in reader.pages:
-            redacted_text += page.extract_text()
+    redacted_text = extract_pdf_text(redacted_file)
     
     print(redacted_text)
     
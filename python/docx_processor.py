@@ -9,13 +9,58 @@ from main import CommonProcessor
 
 
 class DocxProcessor(CommonProcessor):
-    """DOCX document processor"""
+    """
+    DOCX document processor
     
-    def __init__(self, redactor):
-        super().__init__(redactor)
+    process() goes through process_streaming, not read_content/save_content;
+    those remain for callers that want the whole text or to write it back.
+    """
+    
+    def __init__(self, redactor, verbose: bool = False):
+        super().__init__(redactor, verbose)
+    
+    def process_streaming(self, input_file_path: str, output_path: str):
+        """
+        Redact a DOCX paragraph by paragraph, adding each to the output as it is read
+        
+        Each paragraph is redacted on its own, so a pattern can no longer match
+        across a paragraph break: "password:" at the end of one paragraph does
+        not redact the value that starts the next, as it did when the whole text
+        was redacted at once.
+        """
+        try:
+            input_doc = Document(input_file_path)
+        except Exception as e:
+            raise Exception(f"Error reading DOCX file: {e}")
+        
+        doc = Document()
+        
+        # Add title
+        title = doc.add_paragraph("REDACTED DOCUMENT")
+        title.alignment = 1  # Center alignment
+        
+        paragraph_count = 0
+        for paragraph in input_doc.paragraphs:
+            redacted = self.redactor.redact_sensitive_information(paragraph.text)
+            # Line breaks inside a paragraph become paragraphs, as in save_content
+            for line in redacted.split('\n'):
+                doc.add_paragraph(line if line.strip() else "")
+            paragraph_count += 1
+        
+        print(f"Paragraphs redacted: {paragraph_count}")
+        try:
+            doc.save(output_path)
+            print(f"✅ DOCX successfully created: {output_path}")
+        except Exception as e:
+            print(f"❌ Error creating DOCX: {e}")
+            # Fallback: save the redacted paragraphs, without the title, as text
+            text_path = output_path.replace(".docx", "_fallback.txt")
+            with open(text_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(paragraph.text for paragraph in doc.paragraphs[1:]))
+            print(f"💾 Saved as text file instead: {text_path}")
     
     def read_content(self, file_path: str) -> str:
-        """Read content from DOCX file"""
+        """Read content from DOCX file (not used by process, which streams)"""
         try:
             doc = Document(file_path)
             content = []
@@ -8,9 +8,52 @@ such as names, emails, phone numbers, and other personally identifiable informat
 import os
 import re
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
 from pathlib import Path
 
+# The last rules in the list match capitalised name pairs; they need no
+# structured-rule trigger character
+_NAME_RULE_COUNT = 2
+
+# No rule can match fewer characters than a name pair like "Ab Cd", so shorter
+# text skips every pass
+_MIN_MATCH_LENGTH = 5
+
+# Each structured rule (every rule before the name rules) needs one of these:
+# an email's '@', a digit, or the ':'/'=' after a password, API key or token
+# keyword. Replacement tokens contain none, so if the content has none, no
+# structured pass can match and each of them is skipped.
+_STRUCTURED_TRIGGER = re.compile(r'[@:=\d]')
+
+# Characters on which Python's \b, \s and \d disagree with Hyperscan's ASCII
+# classes (non-ASCII text and the \x1c-\x1f separators); such text stays on re
+_HYPERSCAN_UNSAFE = re.compile(r'[^\x00-\x1b\x20-\x7f]')
+
+# Characters of document content printed by a processor unless it is verbose
+_PREVIEW_CHARS = 500
+
+
+@lru_cache(maxsize=None)
+def _load_hyperscan():
+    """Return the hyperscan module, or None when it is not installed"""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    return hyperscan
+
+
+@lru_cache(maxsize=None)
+def _load_name_scanner():
+    """Return the compiled name-pair scanner, or None without NumPy and Numba"""
+    try:
+        from name_scanner import name_pair_spans
+    except ImportError:
+        return None
+    return name_pair_spans
+
 
 def main():
     """Main program entry point"""
@@ -25,23 +68,61 @@ def main():
 class DocumentProcessorFactory:
     """Factory class to create appropriate document processors"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.redactor = DocumentRedactor()
+        self.verbose = verbose
     
     def process_document(self, input_file_path: str):
         """Process a document based on its file extension"""
+        processor = self._create_processor(input_file_path)
+        processor.process(input_file_path)
+    
+    def _create_processor(self, input_file_path: str) -> 'CommonProcessor':
+        """Create the processor for a document based on its file extension"""
         extension = Path(input_file_path).suffix.lower()
         
         if extension == ".docx":
             from docx_processor import DocxProcessor
-            processor = DocxProcessor(self.redactor)
+            return DocxProcessor(self.redactor, self.verbose)
         elif extension == ".pdf":
             from pdf_processor import PdfProcessor
-            processor = PdfProcessor(self.redactor)
+            return PdfProcessor(self.redactor, self.verbose)
         else:
             raise NotSupportedError(f"File format {extension} is not supported")
+    
+    def process_directory(self, dir_path: str, workers: int = None):
+        """Process every DOCX and PDF file in a directory, one document per worker process"""
+        input_paths = sorted(
+            str(path) for path in Path(dir_path).iterdir()
+            if path.is_file() and path.suffix.lower() in (".docx", ".pdf")
+        )
         
-        processor.process(input_file_path)
+        # Parsing and redaction are CPU-bound, so processes rather than threads
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                                 initargs=(self.verbose,)) as executor:
+            errors = [error for error in executor.map(_process_in_worker, input_paths) if error]
+        
+        for error in errors:
+            print(f"Error: {error}")
+
+
+# Each worker process builds its own factory once, so the rules are compiled per process
+_worker_factory = None
+
+
+def _init_worker(verbose: bool):
+    """Create the factory used by this worker process"""
+    global _worker_factory
+    _worker_factory = DocumentProcessorFactory(verbose)
+
+
+def _process_in_worker(input_file_path: str):
+    """Process one document in a worker process, returning an error message on failure"""
+    try:
+        _worker_factory.process_document(input_file_path)
+    except Exception as e:
+        return f"{input_file_path}: {e}"
+    return None
 
 
 class IDocumentProcessor(ABC):
@@ -55,19 +136,30 @@ class IDocumentProcessor(ABC):
 class CommonProcessor(IDocumentProcessor):
     """Common base functionality shared by all processors"""
     
-    def __init__(self, redactor):
+    def __init__(self, redactor, verbose: bool = False):
         self.redactor = redactor
+        # Print whole documents rather than a preview of their first characters
+        self.verbose = verbose
     
     def process(self, input_file_path: str):
         """Common workflow for all document types"""
         print(f"\nProcessing: {input_file_path}")
         
+        # Processors that can redact and write a document piece by piece,
+        # without holding its whole text, override process_streaming; process
+        # then skips read_content and save_content
+        if type(self).process_streaming is not CommonProcessor.process_streaming:
+            output_path = self.generate_output_path(input_file_path)
+            self.process_streaming(input_file_path, output_path)
+            print(f"\nRedacted content saved to: {output_path}")
+            return
+        
         # Read document content
         original_content = self.read_content(input_file_path)
         print("Document content loaded successfully!")
         print(f"Content length: {len(original_content)} characters")
         print("\n--- Original Document Content ---")
-        print(original_content)
+        print(self._preview(original_content))
         
         # Redact sensitive information
         redacted_content = self.redactor.redact_sensitive_information(original_content)
@@ -77,9 +169,19 @@ class CommonProcessor(IDocumentProcessor):
         self.save_content(input_file_path, output_path, redacted_content)
         
         print("\n--- Redacted Document Content ---")
-        print(redacted_content)
+        print(self._preview(redacted_content))
         print(f"\nRedacted content saved to: {output_path}")
     
+    def process_streaming(self, input_file_path: str, output_path: str):
+        """Redact a document piece by piece, writing the output as it goes"""
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+    
+    def _preview(self, content: str) -> str:
+        """Return the content to print: all of it when verbose, otherwise its start"""
+        if self.verbose or len(content) <= _PREVIEW_CHARS:
+            return content
+        return content[:_PREVIEW_CHARS] + '…'
+    
     @abstractmethod
     def read_content(self, file_path: str) -> str:
         pass
@@ -97,21 +199,137 @@ class DocumentRedactor:
     """Handles redacting sensitive information (shared across all file types)"""
     
     def __init__(self):
+        # Rules and their compiled stages are built by the first redactor of a
+        # class and shared by every later one, so each process compiles once
+        cls = type(self)
+        if '_compiled_rules' not in cls.__dict__:
+            cls._compiled_rules = self._compile_rules()
+        self.redaction_rules, self._patterns, self._hyperscan_databases = cls._compiled_rules
+    
+    def _compile_rules(self) -> tuple:
+        """Build the rules, their compiled patterns and, with Hyperscan, their databases"""
         self.redaction_rules = self._initialize_redaction_rules()
+        
+        # Every rule keeps its own pass, in list order, over the text redacted by
+        # the rules before it. Merging rules into one alternation changes which
+        # rule wins on glued text such as "password: hunter2(555) 123-4567"
+        # (the password match would stop short of the phone number it used to
+        # swallow), leaving digits in clear.
+        self._patterns = [re.compile(rule.pattern, rule.flags) for rule in self.redaction_rules]
+        
+        # With Hyperscan installed each rule is also compiled into a DFA
+        # database that scans the bytes for the rule's matches
+        self._hyperscan_databases = None
+        if _load_hyperscan() is not None:
+            self._hyperscan_databases = [self._compile_hyperscan(rule) for rule in self.redaction_rules]
+        
+        return self.redaction_rules, self._patterns, self._hyperscan_databases
     
     def redact_sensitive_information(self, content: str) -> str:
         """Apply all redaction rules to the content"""
+        if len(content) < _MIN_MATCH_LENGTH or content.isspace():
+            return content
+        
         redacted = content
         
-        for rule in self.redaction_rules:
-            redacted = re.sub(rule.pattern, rule.replacement, redacted, flags=rule.flags)
+        # The plain name rule comes last and runs as a compiled byte scanner
+        # when Numba is installed; replacements are ASCII, so checking the
+        # original content is enough
+        name_pair_spans = _load_name_scanner() if content.isascii() else None
+        use_scanner = name_pair_spans is not None
+        last = len(self._patterns) - 1 if use_scanner else len(self._patterns)
+        
+        # Text without any structured-rule trigger only needs the name passes
+        first = 0 if _STRUCTURED_TRIGGER.search(content) else len(self._patterns) - _NAME_RULE_COUNT
+        
+        # One pass per rule, in list order, each over the previous pass's
+        # output. A pass builds its result with a single join: re.sub does so
+        # internally, and the Hyperscan and name-scanner passes join the
+        # slices between their spans.
+        for index in range(first, last):
+            pattern = self._patterns[index]
+            replacement = self.redaction_rules[index].replacement
+            if self._hyperscan_databases and not _HYPERSCAN_UNSAFE.search(redacted):
+                redacted = self._hyperscan_sub(self._hyperscan_databases[index], pattern, replacement, redacted)
+            else:
+                redacted = pattern.sub(replacement, redacted)
+        
+        if use_scanner:
+            redacted = self._replace_name_pairs(redacted, name_pair_spans(redacted))
         
         return redacted
     
+    def _compile_hyperscan(self, rule: 'RedactionRule'):
+        """Compile a rule into a Hyperscan database"""
+        hyperscan = _load_hyperscan()
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+        if rule.flags & re.IGNORECASE:
+            flags |= hyperscan.HS_FLAG_CASELESS
+        
+        database = hyperscan.Database()
+        database.compile(expressions=[rule.pattern.encode('ascii')], ids=[0], flags=[flags])
+        return database
+    
+    def _hyperscan_sub(self, database, pattern: re.Pattern, replacement: str, content: str) -> str:
+        """Replace the matches Hyperscan finds for a rule, as pattern.sub would"""
+        # Hyperscan reports every end offset with its leftmost start; keep the
+        # longest match per start, which is what the greedy regex takes
+        ends = {}
+        
+        def on_match(pattern_id, start, end, flags, context):
+            if end > ends.get(start, -1):
+                ends[start] = end
+        
+        database.scan(content.encode('ascii'), match_event_handler=on_match)
+        candidates = sorted(ends.items())
+        
+        # Leftmost match wins. A match that straddles the last replacement can
+        # hide a later-starting match with the same end, so the regex resumes
+        # the search in that case.
+        parts = []
+        cursor = 0
+        position = 0
+        reach = 0
+        while True:
+            while position < len(candidates) and candidates[position][0] < cursor:
+                reach = max(reach, candidates[position][1])
+                position += 1
+            
+            if reach > cursor:
+                match = pattern.search(content, cursor)
+                if match is None:
+                    break
+                start, end = match.span()
+            elif position < len(candidates):
+                start, end = candidates[position]
+            else:
+                break
+            
+            parts.append(content[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(content[cursor:])
+        
+        return "".join(parts)
+    
+    def _replace_name_pairs(self, content: str, spans: List[Tuple[int, int]]) -> str:
+        """Replace the spans found by the name-pair scanner with the name rule's replacement"""
+        replacement = self.redaction_rules[-1].replacement
+        
+        parts = []
+        cursor = 0
+        for start, end in spans:
+            parts.append(content[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(content[cursor:])
+        
+        return "".join(parts)
+    
     def _initialize_redaction_rules(self) -> List['RedactionRule']:
         """Initialize all redaction rules"""
         return [
-            RedactionRule(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]'),
+            RedactionRule(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', '[EMAIL_REDACTED]'),
             RedactionRule(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b', '[PHONE_REDACTED]'),
             RedactionRule(r'\b\d{3}-\d{2}-\d{4}\b', '[SSN_REDACTED]'),
             RedactionRule(r'\b(?:\d{4}[-\s]?){3}\d{4}\b', '[CREDIT_CARD_REDACTED]'),
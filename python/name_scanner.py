@@ -0,0 +1,56 @@
+"""
+Compiled scanner for the plain name rule (\\b[A-Z][a-z]+ [A-Z][a-z]+\\b).
+
+Requires NumPy and Numba; main.py imports this module on first use and falls
+back to the regex rule when either is missing.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _is_word_byte(byte):
+    return 48 <= byte <= 57 or 65 <= byte <= 90 or 97 <= byte <= 122 or byte == 95
+
+
+@njit(cache=True)
+def _capitalised_word_end(buf, start):
+    # End of an [A-Z][a-z]+ run starting at start, or -1
+    n = buf.shape[0]
+    if start >= n or not 65 <= buf[start] <= 90:
+        return -1
+    end = start + 1
+    while end < n and 97 <= buf[end] <= 122:
+        end += 1
+    return end if end > start + 1 else -1
+
+
+@njit(cache=True)
+def find_name_pairs(buf):
+    """Return (start, end) spans of \\b[A-Z][a-z]+ [A-Z][a-z]+\\b in an ASCII byte buffer"""
+    n = buf.shape[0]
+    # A match and the boundary after it take at least six bytes
+    spans = np.empty((n // 6 + 1, 2), np.int64)
+    count = 0
+    i = 0
+    while i < n:
+        if i == 0 or not _is_word_byte(buf[i - 1]):
+            first = _capitalised_word_end(buf, i)
+            if first > 0 and first < n and buf[first] == 32:
+                end = _capitalised_word_end(buf, first + 1)
+                if end > 0 and (end == n or not _is_word_byte(buf[end])):
+                    spans[count, 0] = i
+                    spans[count, 1] = end
+                    count += 1
+                    i = end
+                    continue
+        i += 1
+    return spans[:count]
+
+
+def name_pair_spans(content: str) -> List[Tuple[int, int]]:
+    """Return the (start, end) spans of name pairs in ASCII text"""
+    return find_name_pairs(np.frombuffer(content.encode('ascii'), np.uint8)).tolist()
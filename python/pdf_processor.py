@@ -2,58 +2,125 @@
 PDF document processor for Python version
 """
 
-import PyPDF2
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from typing import List
 from main import CommonProcessor
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PyPDF2 and ReportLab are imported where they are used: PyPDF2 is only the
+# fallback extractor and ReportLab is only needed when writing the output PDF
+
+
+# Common character encoding issues in extracted text
+_CHARACTER_FIXES = str.maketrans({'ﬁ': 'fi', '�': 'fi'})
+
+# Whitespace clean-up in one pass: a tab or a run of 2+ spaces/tabs becomes one
+# space, a run of blank lines becomes one blank line, and \r\n or \r becomes \n
+_WHITESPACE = re.compile(r'(?P<spaces>[ \t]{2,}|\t)|(?P<blank>(?>\r\n?|\n)\s*(?:\r\n?|\n))|\r\n?')
+_WHITESPACE_REPLACEMENTS = {'spaces': ' ', 'blank': '\n\n', None: '\n'}
+
+# PDFs with at least this many pages have their text extracted in worker
+# processes. PyPDF2 extracts a page in about 4 ms, while starting the pool and
+# re-parsing the PDF in every worker costs about 7 ms per worker plus 0.2 ms per
+# page, so shorter documents are faster in this process.
+_PARALLEL_PAGE_THRESHOLD = 64
+_MAX_PAGE_WORKERS = 8
+
+# Each page worker maps and parses the PDF once, then extracts the pages it is given
+_worker_reader = None
+
+
+def _map_file(file_path: str) -> mmap.mmap:
+    """Map a file read-only, so the OS pages it in on demand instead of Python copying it"""
+    with open(file_path, 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _init_page_worker(file_path: str):
+    """Parse the PDF in a page worker process; the mapping lives as long as the worker"""
+    import PyPDF2
+    
+    global _worker_reader
+    _worker_reader = PyPDF2.PdfReader(_map_file(file_path))
+
+
+def _extract_page(page_num: int) -> str:
+    """Extract the text of one page in a page worker process"""
+    return _worker_reader.pages[page_num].extract_text()
+
 
 class PdfProcessor(CommonProcessor):
     """PDF document processor"""
     
-    def __init__(self, redactor):
-        super().__init__(redactor)
+    def __init__(self, redactor, verbose: bool = False):
+        super().__init__(redactor, verbose)
     
     def read_content(self, file_path: str) -> str:
         """Read content from PDF file"""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                content = []
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    # Clean up the extracted text
-                    cleaned_text = self._clean_extracted_text(text)
-                    content.append(cleaned_text)
-                
-                return '\n'.join(content)
-                
+            if pdfium is not None:
+                texts = self._extract_pages_pdfium(file_path)
+            else:
+                texts = self._extract_pages_pypdf2(file_path)
+            
+            content = []
+            for text in texts:
+                # Clean up the extracted text
+                cleaned_text = self._clean_extracted_text(text)
+                content.append(cleaned_text)
+            
+            return '\n'.join(content)
+            
         except Exception as e:
             raise Exception(f"Error reading PDF file: {e}")
     
+    def _extract_pages_pdfium(self, file_path: str) -> List[str]:
+        """Extract the text of every page with PDFium (native C++, much faster than PyPDF2)"""
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            return [page.get_textpage().get_text_range() for page in pdf]
+        finally:
+            pdf.close()
+    
+    def _extract_pages_pypdf2(self, file_path: str) -> List[str]:
+        """Extract the text of every page with PyPDF2"""
+        import PyPDF2
+        
+        # PyPDF2 makes many small seeks and reads; on a mapping they hit the
+        # page cache directly
+        with _map_file(file_path) as mapped:
+            pdf_reader = PyPDF2.PdfReader(mapped)
+            page_count = len(pdf_reader.pages)
+            
+            # Text extraction is pure Python and CPU-bound, so long PDFs are
+            # spread over worker processes; short ones, or a single CPU, are
+            # not worth the start-up
+            workers = min(_MAX_PAGE_WORKERS, os.cpu_count() or 1)
+            if page_count < _PARALLEL_PAGE_THRESHOLD or workers < 2:
+                return [page.extract_text() for page in pdf_reader.pages]
+        
+        # Workers map the file themselves, so no PDF bytes are pickled, and each
+        # receives one contiguous range of pages rather than a page per task
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                                 initargs=(file_path,)) as executor:
+            chunksize = -(-page_count // workers)
+            return list(executor.map(_extract_page, range(page_count), chunksize=chunksize))
+    
     def _clean_extracted_text(self, text: str) -> str:
         """Clean up extracted PDF text"""
         if not text:
             return text
         
-        # Replace multiple tabs and spaces with single space
-        text = re.sub(r'\t+', ' ', text)
-        text = re.sub(r' {2,}', ' ', text)
-        
-        # Fix common character encoding issues
-        text = text.replace('ﬁ', 'fi')
-        text = text.replace('�', 'fi')
-        
-        # Clean up line breaks and spacing
-        text = re.sub(r'\r\n|\r|\n', '\n', text)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = text.translate(_CHARACTER_FIXES)
+        text = _WHITESPACE.sub(lambda match: _WHITESPACE_REPLACEMENTS[match.lastgroup], text)
         
         return text.strip()
     
@@ -94,6 +161,12 @@ class PdfProcessor(CommonProcessor):
     def _create_simple_pdf(self, output_path: str, content: str):
         """Create PDF using ReportLab"""
         try:
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Preformatted, Spacer
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.lib.units import inch
+            from reportlab.pdfbase.pdfmetrics import stringWidth
+            
             # Remove existing file
             if Path(output_path).exists():
                 Path(output_path).unlink()
@@ -136,6 +209,16 @@ class PdfProcessor(CommonProcessor):
             lines = content.split('\n')
             for line in lines:
                 if line.strip():
+                    # A line that clearly fits the frame is drawn as preformatted
+                    # text, skipping Paragraph's markup parser; whitespace is
+                    # collapsed as Paragraph would. Lines within a character of
+                    # the edge or longer still go through Paragraph's wrapping.
+                    text = ' '.join(line.split())
+                    width = stringWidth(text, normal_style.fontName, normal_style.fontSize)
+                    if width < doc.width - normal_style.fontSize:
+                        story.append(Preformatted(text, normal_style))
+                        continue
+                    
                     # Escape special characters for ReportLab
                     escaped_line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
                     story.append(Paragraph(escaped_line, normal_style))
@@ -0,0 +1,129 @@
+"""
+Tests for DocumentRedactor: the compiled redaction paths must give the same
+output as applying every rule with re.sub, one after another
+"""
+
+import random
+import re
+
+import pytest
+
+import main
+from main import DocumentRedactor
+
+
+GLUED_TOKENS = [
+    "John Smith", "Jane Doe (CEO)", "jane@x.com", "Doe@x.com", "555-123-4567",
+    "(555) 123-4567", "+1 555 123 4567", "123-45-6789", "4532 1234 5678 9012",
+    "4532123456789012", "12/25/2023", "1-2-99", "password: hunter2", "PWD=abc",
+    "pass :x", "api_key: XYZ", "token=abc", "auth-token: q", "10.0.0.1", "999.1.1.1",
+    "x", "\n", "(", ")", "Mary Ann", "Call", "1", "-", ".", " ", "José Núñez",
+]
+
+
+def baseline_redact(redactor: DocumentRedactor, content: str) -> str:
+    """The original implementation: each rule's re.sub over the previous result"""
+    for rule in redactor.redaction_rules:
+        content = re.sub(rule.pattern, rule.replacement, content, flags=rule.flags)
+    return content
+
+
+def glued_samples(count: int, seed: int):
+    """Tokens run together the way PyPDF2 joins extracted lines"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        separator = rng.choice(["", "", " "])
+        yield separator.join(rng.choice(GLUED_TOKENS) for _ in range(rng.randint(1, 12)))
+
+
+@pytest.fixture
+def redactor():
+    return DocumentRedactor()
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("password: hunter2(555) 123-4567", "[PASSWORD_REDACTED]"),
+    ("api_key=abc(555) 123-4567", "[API_KEY_REDACTED]"),
+    ("token=abc555-123-4567", "[TOKEN_REDACTED]"),
+    ("Dr John Smith (CEO)", "Dr [NAME_REDACTED] (TITLE_REDACTED)"),
+])
+def test_glued_keyword_values(redactor, content, expected):
+    assert redactor.redact_sensitive_information(content) == expected
+    assert baseline_redact(redactor, content) == expected
+
+
+def test_matches_baseline_on_glued_text(redactor):
+    for content in glued_samples(3000, seed=11):
+        assert redactor.redact_sensitive_information(content) == baseline_redact(redactor, content), content
+
+
+def test_matches_baseline_without_optional_engines(redactor, monkeypatch):
+    monkeypatch.setattr(redactor, "_hyperscan_databases", None)
+    monkeypatch.setattr(main, "_load_name_scanner", lambda: None)
+    for content in glued_samples(1000, seed=12):
+        assert redactor.redact_sensitive_information(content) == baseline_redact(redactor, content), content
+
+
+def _docx_processor(redactor):
+    pytest.importorskip("docx")
+    from docx_processor import DocxProcessor
+    return DocxProcessor(redactor)
+
+
+def _write_docx(path, paragraphs):
+    import docx
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(path)
+
+
+class _WholeTextProcessor(main.CommonProcessor):
+    """Processor without process_streaming, recording what it saves"""
+    
+    def read_content(self, file_path):
+        return "Contact: John Smith"
+    
+    def generate_output_path(self, input_file_path):
+        return "out.txt"
+    
+    def save_content(self, input_file_path, output_path, redacted_content):
+        self.saved = redacted_content
+
+
+def test_processors_without_streaming_read_and_save_whole_text(redactor):
+    processor = _WholeTextProcessor(redactor)
+    processor.process("in.txt")
+    assert processor.saved == "Contact: [NAME_REDACTED]"
+    with pytest.raises(NotImplementedError):
+        processor.process_streaming("in.txt", "out.txt")
+
+
+def test_docx_streaming_does_not_match_across_paragraphs(redactor, tmp_path):
+    """Each paragraph is redacted alone, so a value after a paragraph break is kept"""
+    import docx
+    processor = _docx_processor(redactor)
+    input_path, output_path = tmp_path / "in.docx", tmp_path / "out.docx"
+    _write_docx(input_path, ["password:", "hunter2", "Contact: John Smith"])
+    
+    processor.process_streaming(str(input_path), str(output_path))
+    
+    paragraphs = [paragraph.text for paragraph in docx.Document(output_path).paragraphs]
+    assert paragraphs == ["REDACTED DOCUMENT", "password:", "hunter2", "Contact: [NAME_REDACTED]"]
+    # Redacting the whole text at once would have swallowed the value
+    assert redactor.redact_sensitive_information("password:\nhunter2") == "[PASSWORD_REDACTED]"
+
+
+def test_docx_streaming_falls_back_to_text_when_save_fails(redactor, tmp_path, monkeypatch):
+    import docx.document
+    processor = _docx_processor(redactor)
+    input_path, output_path = tmp_path / "in.docx", tmp_path / "out.docx"
+    _write_docx(input_path, ["Contact: John Smith", "555-123-4567"])
+    
+    def fail(self, path):
+        raise OSError("disk full")
+    monkeypatch.setattr(docx.document.Document, "save", fail)
+    processor.process_streaming(str(input_path), str(output_path))
+    
+    assert not output_path.exists()
+    assert (tmp_path / "out_fallback.txt").read_text(encoding="utf-8") == "Contact: [NAME_REDACTED]\n[PHONE_REDACTED]"